@@ -3,37 +3,68 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import timedelta
+from collections.abc import Callable, Iterable
+import contextlib
+from datetime import datetime, timedelta
 import json
 import logging
+from typing import Any, TypedDict
 import urllib.parse
 
-from aiohttp import ClientError, ClientSession, WSMessage, WSMsgType
+from aiohttp import ClientError, ClientSession, WSMessage, WSMsgType, hdrs
 
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.config_entries import ConfigEntry, current_entry
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import dt as dt_util
 
 from .const import (
+    CONF_GET_URL,
     CONF_HOST,
     CONF_REGION,
     CONF_TEAM_NAME,
     DOMAIN,
+    EVENT_MATCH_FINISHED,
+    EVENT_MATCH_STARTED,
+    GET_HEADERS,
     HEADERS,
     IN_GAME,
+    INGEST_EXECUTOR_THRESHOLD,
     NEAR_GAME,
+    NEAR_GAME_BEFORE,
     NO_GAME,
     PLATFORMS,
     TIMEOUT,
+    TIMELINE_RETENTION,
     TIMEOUT_PERIOD_CHECK,
     URL_GET,
     VERSION,
+    WS_COMPRESS,
+)
+from .archive import DATA_ARCHIVE, async_setup_archive, build_row
+from .events import diff_match_states
+from .logos import async_setup_logo_cache
+from .profiling import profiled
+from .services import async_setup_services
+from .timeline import MatchTimeline
+from .utils import (
+    FINISHED,
+    ID,
+    NAME,
+    STARTED,
+    OverviewChanges,
+    SamsIndex,
+    SamsUtils,
 )
 
 UPDATE_FULL_INTERVAL = timedelta(minutes=5)
 UPDATE_INTERVAL_NO_GAME = timedelta(minutes=60)
+UPDATE_INTERVAL_MAX_IDLE = timedelta(hours=12)
+# safety reconciliation while the websocket delivers the live states
+UPDATE_INTERVAL_WS_HEALTHY = timedelta(minutes=30)
+MAX_IDLE_BACKOFF = 4
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -48,17 +79,31 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     domain_data = hass.data.setdefault(DOMAIN, {})
     name = f"Sams Tracker {entry.data[CONF_REGION].capitalize()}"
     url_ws = urllib.parse.urljoin(entry.data[CONF_HOST], entry.data[CONF_REGION])
-    url_get = urllib.parse.urljoin(URL_GET, entry.data[CONF_REGION])
+    url_get = urllib.parse.urljoin(
+        entry.data.get(CONF_GET_URL, URL_GET), entry.data[CONF_REGION]
+    )
 
     if entry.data[CONF_REGION] in domain_data:
         # we already have a coordinator for that region
         coordinator = domain_data[entry.data[CONF_REGION]]
     else:
-        # create new coordinator for the sams region
+        # create new coordinator for the sams region - it is shared by the
+        # entries of the region and must not be shut down with this one
         session = async_get_clientsession(hass)
-        coordinator = SamsDataCoordinator(hass, session, name, url_ws, url_get)
+        token = current_entry.set(None)
+        try:
+            coordinator = SamsDataCoordinator(
+                hass, session, name, url_ws, url_get, region=entry.data[CONF_REGION]
+            )
+        finally:
+            current_entry.reset(token)
+        await coordinator.async_register_shutdown()
         domain_data[entry.data[CONF_REGION]] = coordinator
 
+    async_setup_services(hass)
+    await async_setup_logo_cache(hass)
+    await async_setup_archive(hass)
+    await coordinator.async_region_first_refresh()
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
@@ -71,6 +116,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         if not in_use:
             coordinator = hass.data[DOMAIN].pop(entry.data[CONF_REGION])
             await coordinator.disconnect()
+            await coordinator.async_shutdown()
             _LOGGER.info(
                 "Sams Volleyball Tracker removed coordinator for region %s ",
                 entry.data[CONF_REGION],
@@ -78,6 +124,21 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+class TransferStats(TypedDict):
+    """Transfer counters of a region, exposed with the diagnostics."""
+
+    get_requests: int
+    get_bytes_wire: int
+    get_bytes_decoded: int
+    get_content_encoding: str | None
+    ws_compression: int | None
+    ws_frames: int
+    ws_bytes_decoded: int
+    ws_frames_suppressed: int
+    ws_frames_skipped: int
+    ws_frames_coalesced: int
+
+
 class SamsDataCoordinator(DataUpdateCoordinator):
     """Class to manage fetching sams ticker data. It is instantiated once per used region/websocket.
 
@@ -92,19 +153,61 @@ class SamsDataCoordinator(DataUpdateCoordinator):
         name: str,
         websocket_url: str,
         get_url: str,
+        clock: Callable[[], datetime] = dt_util.utcnow,
+        region: str | None = None,
     ) -> None:
-        """Init the data update instance."""
-        ts_now = dt_util.as_timestamp(dt_util.utcnow())
+        """Init the data update instance.
+
+        The clock can be replaced to drive the coordinator by a virtual time.
+        """
+        self._utcnow = clock
+        self.region = region
+        ts_now = self.now_ts()
         self.session = session
         self.websocket_url = websocket_url
         self.get_url = get_url
         self.ws = None
         self.ws_task = None
         self._lock = asyncio.Lock()
-        self.last_get_ts = dt_util.as_timestamp(dt_util.start_of_local_day())
+        self.last_get_ts = dt_util.as_timestamp(
+            dt_util.start_of_local_day(dt_util.as_local(self._utcnow()))
+        )
         self.last_ws_receive_ts = ts_now
         self.last_check_ts = ts_now
         self.connected = False
+        self.timelines: dict[str, MatchTimeline] = {}
+        self._tracked_matches: dict[str, dict] = {}
+        self._tracked_teams: dict[str, str] = {}
+        self._next_kickoff_ts: float | None = None
+        self._idle_polls = 0
+        self._match_states: dict[str, dict] = {}
+        # start and finish of a match are reported once, a lagging overview
+        # must not report them again
+        self._transitions: dict[str, set[str]] = {}
+        self.index: SamsIndex | None = None
+        # teams and matches changed by the last full update, None if unknown
+        self.changes: OverviewChanges | None = None
+        self._last_match_id: str | None = None
+        self._fingerprints: dict[str, tuple] = {}
+        self._first_refresh: asyncio.Task | None = None
+        self._archived: set[str] = set()
+        self._ws_frames_since_connect = 0
+        # latest not yet consumed frame per match uuid, filled by the reader
+        self._mailbox: dict[str | None, dict] = {}
+        self._mailbox_event = asyncio.Event()
+        self._consumer_task: asyncio.Task | None = None
+        self.stats: TransferStats = {
+            "get_requests": 0,
+            "get_bytes_wire": 0,
+            "get_bytes_decoded": 0,
+            "get_content_encoding": None,
+            "ws_compression": None,
+            "ws_frames": 0,
+            "ws_bytes_decoded": 0,
+            "ws_frames_suppressed": 0,
+            "ws_frames_skipped": 0,
+            "ws_frames_coalesced": 0,
+        }
         self.loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
         super().__init__(
             hass,
@@ -114,11 +217,64 @@ class SamsDataCoordinator(DataUpdateCoordinator):
         )
         _LOGGER.debug("Init coordinator for region %s", self.name)
 
+    def now_ts(self) -> float:
+        """Return the time of the coordinator clock as timestamp."""
+        return dt_util.as_timestamp(self._utcnow())
+
+    async def async_region_first_refresh(self) -> None:
+        """Refresh once for all config entries of the region.
+
+        Entries set up concurrently during start-up await the same refresh, so
+        the region is downloaded only once regardless of the number of entries.
+        """
+        if self._first_refresh is None:
+            self._first_refresh = self.hass.async_create_task(self.async_refresh())
+        await asyncio.shield(self._first_refresh)
+        if not self.last_update_success:
+            self._first_refresh = None
+            raise ConfigEntryNotReady(f"{self.name} - initial update failed")
+
+    async def _get_full_body(self) -> bytes:
+        """Get the full data json from SAMS by GET request.
+
+        The body is transferred compressed if the server supports it - it is
+        read undecoded to count the bytes on the wire and decompressed here.
+        """
+        async with self.session.get(
+            self.get_url,
+            headers=GET_HEADERS,
+            raise_for_status=True,
+            auto_decompress=False,
+        ) as resp:
+            raw = await resp.read()
+            encoding = resp.headers.get(hdrs.CONTENT_ENCODING)
+        body = SamsUtils.decompress(raw, encoding)
+        self.stats["get_requests"] += 1
+        self.stats["get_bytes_wire"] += len(raw)
+        self.stats["get_bytes_decoded"] += len(body)
+        self.stats["get_content_encoding"] = encoding
+        _LOGGER.debug(
+            "%s received full ticker json (%d bytes, wire %d)",
+            self.name,
+            len(body),
+            len(raw),
+        )
+        return body
+
     async def get_full_data(self) -> dict:
-        """Get the full data json from SAMS by GET request."""
-        resp = await self.session.get(self.get_url, raise_for_status=True)
-        _LOGGER.debug("%s received full ticker json", self.name)
-        return await resp.json()
+        """Get the full data json from SAMS decoded."""
+        index, _ = await self._async_ingest(await self._get_full_body())
+        return index.data
+
+    async def _async_ingest(
+        self, body: bytes
+    ) -> tuple[SamsIndex, OverviewChanges | None]:
+        """Decode, index and diff the data - large regions off the event loop."""
+        if len(body) > INGEST_EXECUTOR_THRESHOLD:
+            return await self.hass.async_add_executor_job(
+                SamsIndex.ingest, body, self.index
+            )
+        return SamsIndex.ingest(body, self.index)
 
     async def _async_update_data(self):
         """Fetch data from API endpoint.
@@ -126,8 +282,19 @@ class SamsDataCoordinator(DataUpdateCoordinator):
         This is the place to pre-process the data to lookup tables
         so entities can quickly look up their data.
         """
-        data = await self.get_full_data()
-        self.last_get_ts = dt_util.as_timestamp(dt_util.utcnow())
+        self.index, self.changes = await self._async_ingest(await self._get_full_body())
+        data = self.index.data
+        self.last_get_ts = self.now_ts()
+        self._update_schedule(self.index, self.last_get_ts)
+        for match_id in self.tracked_match_ids():
+            match_state = SamsUtils.get_match_state(data, match_id)
+            if match_state:
+                self._fire_match_events(match_id, match_state)
+        self._archive_finished(
+            (match, SamsUtils.get_match_state(data, match[ID]))
+            for team_id in set(self._tracked_teams.values())
+            for match in self.index.get_matches(team_id)
+        )
         return data
 
     async def _on_close(self):
@@ -137,73 +304,297 @@ class SamsDataCoordinator(DataUpdateCoordinator):
     async def _on_open(self):
         _LOGGER.info("Connection opened - %s", self.name)
         self.connected = True
+        self._ws_frames_since_connect = 0
+
+    def profile_context(self) -> tuple[str, str | None]:
+        return self.name, self._last_match_id
 
+    @profiled("_on_message")
     async def _on_message(self, message: WSMessage):
+        """Decode a frame and leave it in the mailbox for the consumer.
+
+        Timelines and events see every frame, the state writes of the
+        consumer only the latest state of a match.
+        """
+        self._last_match_id = None
         if message.type == WSMsgType.TEXT:
+            self.stats["ws_frames"] += 1
+            self.stats["ws_bytes_decoded"] += len(message.data)
+            self._ws_frames_since_connect += 1
+            match_id = SamsUtils.peek_match_uuid(message.data)
+            if match_id is not None and match_id not in self.tracked_match_ids():
+                # update of a match no sensor is interested in - skip decoding
+                self._last_match_id = match_id
+                self.stats["ws_frames_skipped"] += 1
+                self.last_ws_receive_ts = self.now_ts()
+                return
             data = json.loads(message.data)
             _LOGGER.debug("Received data: %s ", str(message)[1:500])
             if data:
-                self.async_set_updated_data(data)
-                self.last_ws_receive_ts = dt_util.as_timestamp(dt_util.utcnow())
+                ts = self.now_ts()
+                self.last_ws_receive_ts = ts
+                if not self._accept(data, ts):
+                    return
+                key = self._last_match_id
+                if key in self._mailbox:
+                    # the consumer did not catch up - only the latest state counts
+                    self.stats["ws_frames_coalesced"] += 1
+                self._mailbox[key] = data
+                self._mailbox_event.set()
         else:
             _LOGGER.info(
                 "%s - received unexpected message: %s ", self.name, str(message)[1:500]
             )
 
+    async def _consume_messages(self):
+        """Hand the latest state of each match in the mailbox to the sensors."""
+        while True:
+            await self._mailbox_event.wait()
+            self._mailbox_event.clear()
+            while self._mailbox:
+                key = next(iter(self._mailbox))
+                data = self._mailbox.pop(key)
+                try:
+                    self._write_data(data)
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception("Error during processing new message")
+                # let the reader fill the mailbox in between
+                await asyncio.sleep(0)
+
+    def _on_data(self, data: dict, ts: float):
+        if self._accept(data, ts):
+            self._write_data(data)
+
+    def _accept(self, data: dict, ts: float) -> bool:
+        """Record timeline and events of a frame, False for duplicates."""
+        self._last_match_id = (
+            SamsUtils.get_match_uuid(data) if SamsUtils.is_match(data) else None
+        )
+        if self._is_duplicate(data):
+            self.stats["ws_frames_suppressed"] += 1
+            return False
+        self._process_match_update(data, ts)
+        return True
+
+    @profiled("_on_data")
+    def _write_data(self, data: dict):
+        self._last_match_id = (
+            SamsUtils.get_match_uuid(data) if SamsUtils.is_match(data) else None
+        )
+        self.async_set_updated_data(data)
+
+    def _is_duplicate(self, data: dict) -> bool:
+        """Check if a match update does not change the known state of the match."""
+        if not SamsUtils.is_match(data):
+            return False
+        match_id = SamsUtils.get_match_uuid(data)
+        fingerprint = SamsUtils.match_fingerprint(SamsUtils.get_match_data(data))
+        if self._fingerprints.get(match_id) == fingerprint:
+            return True
+        self._fingerprints[match_id] = fingerprint
+        return False
+
+    def _process_match_update(self, data: dict, ts: float):
+        """Record timeline and fire events for updates of tracked matches."""
+        if not SamsUtils.is_match(data):
+            return
+        match_state = SamsUtils.get_match_data(data)
+        match_id = SamsUtils.get_match_uuid(data)
+        self._last_match_id = match_id
+        if match_id not in self.tracked_match_ids():
+            return
+        if match_id not in self.timelines:
+            self.timelines[match_id] = MatchTimeline(match_id)
+        self.timelines[match_id].add_state(ts, match_state)
+        events = self._fire_match_events(match_id, match_state)
+        if any(
+            event_type in (EVENT_MATCH_STARTED, EVENT_MATCH_FINISHED)
+            for event_type, _ in events
+        ):
+            # the state of the trackers, after the match also the rankings and
+            # the next match change - reconcile the full data
+            self.hass.async_create_task(self.async_request_refresh())
+
+    def _evict_timelines(self, ts: float):
+        tracked = self.tracked_match_ids()
+        for match_id in set(self._match_states) - tracked:
+            del self._match_states[match_id]
+        for match_id in set(self._transitions) - tracked:
+            del self._transitions[match_id]
+        for match_id, timeline in list(self.timelines.items()):
+            if match_id not in tracked or (
+                timeline.finished_ts is not None
+                and ts - timeline.finished_ts > TIMELINE_RETENTION
+            ):
+                _LOGGER.debug("%s - drop timeline of match %s", self.name, match_id)
+                del self.timelines[match_id]
+
+    def _fire_match_events(
+        self, match_id: str, match_state: dict
+    ) -> list[tuple[str, dict]]:
+        match = next(m for m in self._tracked_matches.values() if m[ID] == match_id)
+        transitions = self._transitions.setdefault(match_id, set())
+        events = [
+            (event_type, event_data)
+            for event_type, event_data in diff_match_states(
+                self._match_states.get(match_id), match_state
+            )
+            if event_type not in transitions
+        ]
+        if match_state.get(STARTED):
+            transitions.add(EVENT_MATCH_STARTED)
+        if match_state.get(FINISHED):
+            transitions.add(EVENT_MATCH_FINISHED)
+        self._match_states[match_id] = match_state
+        if match_state.get(FINISHED):
+            self._archive_finished([(match, match_state)])
+        for event_type, event_data in events:
+            _LOGGER.debug("%s - fire %s for %s", self.name, event_type, match_id)
+            self.hass.bus.async_fire(
+                event_type,
+                {
+                    "match_id": match_id,
+                    "team1_id": match["team1"],
+                    "team2_id": match["team2"],
+                    **event_data,
+                },
+            )
+        return events
+
+    def _archive_finished(self, matches: Iterable[tuple[dict, dict | None]]):
+        """Store finished matches not archived yet in the local archive."""
+        archive = self.hass.data.get(DATA_ARCHIVE)
+        if archive is None or self.index is None or self.region is None:
+            return
+        rows = []
+        for match, match_state in matches:
+            if match[ID] in self._archived or not (
+                match_state and match_state.get(FINISHED)
+            ):
+                continue
+            team1, league = self.index.get_team_by_id(match["team1"])
+            team2, _ = self.index.get_team_by_id(match["team2"])
+            if league is None:
+                # not part of a known league yet, archived with a later overview
+                continue
+            rows.append(
+                build_row(self.region, match, match_state, team1, team2, league[NAME])
+            )
+            self._archived.add(match[ID])
+        if rows:
+            self.hass.async_create_task(archive.async_add(rows))
+
+    def _update_schedule(self, index: SamsIndex, ts: float):
+        """Track the next kickoff of the tracked teams to adapt the idle polling."""
+        next_kickoff_ts = index.get_next_kickoff(set(self._tracked_teams.values()), ts)
+        if next_kickoff_ts != self._next_kickoff_ts:
+            _LOGGER.debug(
+                "%s - next kickoff of tracked teams changed to %s",
+                self.name,
+                next_kickoff_ts,
+            )
+            self._next_kickoff_ts = next_kickoff_ts
+            self._idle_polls = 0
+        elif not self._game_nearby():
+            self._idle_polls = min(self._idle_polls + 1, MAX_IDLE_BACKOFF)
+            self.update_interval = self._idle_interval(ts)
+
+    def _idle_interval(self, ts: float) -> timedelta:
+        """Back off exponentially while idle, but poll in time for the next kickoff."""
+        interval = min(
+            UPDATE_INTERVAL_NO_GAME * (2**self._idle_polls), UPDATE_INTERVAL_MAX_IDLE
+        )
+        if self._next_kickoff_ts is not None:
+            until_nearby = self._next_kickoff_ts - NEAR_GAME_BEFORE - ts
+            interval = min(interval, timedelta(seconds=max(until_nearby / 2, 0)))
+        return max(interval, UPDATE_FULL_INTERVAL)
+
+    def track(self, key: str, team_id: str | None, match: dict | None):
+        """Register the team and match a sensor is currently tracking."""
+        if team_id != self._tracked_teams.get(key):
+            # poll soon to pick up the schedule of the new team
+            self._idle_polls = 0
+        if team_id:
+            self._tracked_teams[key] = team_id
+        else:
+            self._tracked_teams.pop(key, None)
+        if match:
+            self._tracked_matches[key] = match
+        else:
+            self._tracked_matches.pop(key, None)
+
+    def untrack(self, key: str):
+        """Remove the registration of a sensor."""
+        self.track(key, None, None)
+
+    def tracked_match_ids(self) -> set[str]:
+        return {match[ID] for match in self._tracked_matches.values()}
+
     async def _process_messages(self):
         try:
             async for msg in self.ws:
                 await self._on_message(msg)
+            _LOGGER.debug("%s - websocket closed by server", self.name)
+            await self._on_close()
         except RuntimeError as exc:
             _LOGGER.warning("Sams Websocket runtime error %s", exc)
             await self._on_close()
         except ConnectionResetError:
             _LOGGER.info("%s Websocket Connection Reset", self.name)
             await self._on_close()
-        except Exception as exc:  # pylint: disable=broad-except
-            _LOGGER.warning(
-                "Error during processing new message: %s", exc.with_traceback()
-            )
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error during processing new message")
+            await self._on_close()
 
     async def _connect_ws(self):
         async with self._lock:
             if not self.ws or not self.connected:
                 _LOGGER.info("Connect to %s", self.websocket_url)
+                if self.ws is not None:
+                    # do not leak a stale socket when reconnecting
+                    await self.ws.close()
                 try:
                     self.ws = await self.session.ws_connect(
                         self.websocket_url,
                         autoclose=False,
                         headers=HEADERS,
+                        compress=WS_COMPRESS,
                     )
+                    self.stats["ws_compression"] = self.ws.compress
                     self.loop = asyncio.get_event_loop()
                     self.ws_task = self.loop.create_task(self._process_messages())
+                    if self._consumer_task is None:
+                        self._consumer_task = self.loop.create_task(
+                            self._consume_messages()
+                        )
                     await self._on_open()
                 except ClientError as exc:  # pylint: disable=broad-except
                     _LOGGER.warning("Error during processing new message: %s", exc)
-                    self.disconnect()
+                    await self.disconnect()
 
     async def disconnect(self):
         """Close web socket connection."""
-        if self.ws_task is not None:
-            self.ws_task.cancel()
-            self.ws_task = None
+        for attr in ("ws_task", "_consumer_task"):
+            task = getattr(self, attr)
+            if task is not None:
+                setattr(self, attr, None)
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+        self._mailbox.clear()
         if self.ws is not None:
             await self.ws.close()
             self.ws = None
 
+    @profiled("periodic_work")
     async def periodic_work(self, now):
         ts = dt_util.as_timestamp(now)
         if ts - self.last_check_ts > TIMEOUT_PERIOD_CHECK:
             if self._game_nearby():
-                if self.update_interval != UPDATE_FULL_INTERVAL:
-                    _LOGGER.debug(
-                        "%s - game nearby - increase update interval to 5 min",
-                        self.name,
-                    )
-                    self.update_interval = UPDATE_FULL_INTERVAL
                 if not self.ws or not self.connected:
                     await self._connect_ws()
                     self.last_ws_receive_ts = ts
+                    await self._reconcile(ts)
                 timeout = (
                     TIMEOUT[IN_GAME] if self._game_active() else TIMEOUT[NEAR_GAME]
                 )
@@ -212,18 +603,51 @@ class SamsDataCoordinator(DataUpdateCoordinator):
                     await self.disconnect()
                     await self._connect_ws()
                     self.last_ws_receive_ts = ts
+                    await self._reconcile(ts)
+                # the websocket delivers the live states - full GETs are only
+                # a safety net as long as it is healthy
+                interval = (
+                    UPDATE_INTERVAL_WS_HEALTHY
+                    if self._ws_healthy(ts, timeout)
+                    else UPDATE_FULL_INTERVAL
+                )
+                if self.update_interval != interval:
+                    _LOGGER.debug(
+                        "%s - game nearby - set update interval to %s",
+                        self.name,
+                        interval,
+                    )
+                    self.update_interval = interval
             else:
                 if self.ws and self.connected:
                     _LOGGER.info("%s - no game active - close socket", self.name)
                     await self.disconnect()
-                if self.update_interval != UPDATE_INTERVAL_NO_GAME:
+                    self._fingerprints.clear()
+                interval = self._idle_interval(ts)
+                if self.update_interval != interval:
                     _LOGGER.debug(
-                        "%s - no game active - reduce update interval to 60 min",
+                        "%s - no game active - set update interval to %s",
                         self.name,
+                        interval,
                     )
-                    self.update_interval = UPDATE_INTERVAL_NO_GAME
+                    self.update_interval = interval
+            self._evict_timelines(ts)
             self.last_check_ts = ts
 
+    def _ws_healthy(self, ts: float, timeout: float) -> bool:
+        return (
+            self.ws is not None
+            and self.connected
+            and self._ws_frames_since_connect > 0
+            and ts - self.last_ws_receive_ts <= timeout
+        )
+
+    async def _reconcile(self, ts: float):
+        """Fetch the full data after a (re)connect to catch up missed states."""
+        if self.connected and ts - self.last_get_ts > TIMEOUT_PERIOD_CHECK:
+            _LOGGER.debug("%s - reconcile full data after connect", self.name)
+            await self.async_request_refresh()
+
     def _game_active(self) -> bool:
         return any(
             active_cb() == IN_GAME for _, active_cb in list(self._listeners.values())
@@ -234,5 +658,23 @@ class SamsDataCoordinator(DataUpdateCoordinator):
             active_cb() > NO_GAME for _, active_cb in list(self._listeners.values())
         )
 
+    def buffers(self) -> dict[str, Any]:
+        """Return the per match buffers held by the coordinator."""
+        return {
+            "timelines": self.timelines,
+            "match_states": self._match_states,
+            "transitions": self._transitions,
+            "fingerprints": self._fingerprints,
+            "mailbox": self._mailbox,
+        }
+
+    def listener_entities(self) -> list:
+        """Return the entities listening to the coordinator."""
+        return [
+            update_callback.__self__
+            for update_callback, _ in list(self._listeners.values())
+            if hasattr(update_callback, "__self__")
+        ]
+
     def has_listener(self) -> tuple:
         return len(self._listeners) > 0, len(self._listeners)
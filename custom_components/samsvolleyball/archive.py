@@ -0,0 +1,213 @@
+"""Compact local archive of finished matches of the tracked teams."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sqlite3
+from typing import Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant
+
+from .const import ARCHIVE_FILE, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_ARCHIVE = f"{DOMAIN}_archive"
+
+COLUMNS = (
+    "match_id",
+    "region",
+    "league",
+    "kickoff",
+    "team1_id",
+    "team1_name",
+    "team2_id",
+    "team2_name",
+    "team1_sets",
+    "team2_sets",
+    "sets",
+)
+
+SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS matches (
+        match_id TEXT PRIMARY KEY,
+        region TEXT NOT NULL,
+        league TEXT,
+        kickoff INTEGER NOT NULL,
+        team1_id TEXT NOT NULL,
+        team1_name TEXT,
+        team2_id TEXT NOT NULL,
+        team2_name TEXT,
+        team1_sets INTEGER,
+        team2_sets INTEGER,
+        sets TEXT
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_matches_team1 ON matches (team1_id, kickoff)",
+    "CREATE INDEX IF NOT EXISTS idx_matches_team2 ON matches (team2_id, kickoff)",
+    "CREATE INDEX IF NOT EXISTS idx_matches_kickoff ON matches (kickoff)",
+)
+
+
+def build_row(
+    region: str, match: dict, match_state: dict, team1: dict, team2: dict, league: str
+) -> tuple:
+    """Build an archive row of a finished match, the set scores as '25:20 23:25'."""
+    sets = " ".join(
+        f"{match_set['setScore']['team1']}:{match_set['setScore']['team2']}"
+        for match_set in match_state.get("matchSets") or []
+    )
+    set_points = match_state.get("setPoints") or {}
+    return (
+        match["id"],
+        region,
+        league,
+        int(float(match["date"]) / 1000),
+        match["team1"],
+        team1.get("name") if team1 else None,
+        match["team2"],
+        team2.get("name") if team2 else None,
+        set_points.get("team1"),
+        set_points.get("team2"),
+        sets,
+    )
+
+
+class MatchArchive:
+    """SQLite store of finished matches, all access runs in the executor."""
+
+    def __init__(self, hass: HomeAssistant, path: str) -> None:
+        """Init the archive - call async_open() before use."""
+        self.hass = hass
+        self.path = path
+        self._conn: sqlite3.Connection | None = None
+        self._lock = asyncio.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            raise RuntimeError("Match archive is closed")
+        return self._conn
+
+    def _open(self) -> None:
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._conn:
+            for statement in SCHEMA:
+                self._conn.execute(statement)
+
+    def _close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _insert(self, rows: list[tuple]) -> None:
+        conn = self._connection()
+        with conn:
+            conn.executemany(
+                f"INSERT OR REPLACE INTO matches ({', '.join(COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(COLUMNS))})",
+                rows,
+            )
+
+    @staticmethod
+    def _where(
+        team_id: str | None, start: int | None, end: int | None
+    ) -> tuple[str, list[Any]]:
+        where = []
+        params: list[Any] = []
+        if team_id:
+            where.append("(team1_id = ? OR team2_id = ?)")
+            params += [team_id, team_id]
+        if start is not None:
+            where.append("kickoff >= ?")
+            params.append(start)
+        if end is not None:
+            where.append("kickoff < ?")
+            params.append(end)
+        return (" WHERE " + " AND ".join(where) if where else ""), params
+
+    def _query(
+        self, team_id: str | None, start: int | None, end: int | None, limit: int
+    ) -> list[dict[str, Any]]:
+        where, params = self._where(team_id, start, end)
+        sql = (
+            f"SELECT {', '.join(COLUMNS)} FROM matches{where} "
+            "ORDER BY kickoff DESC LIMIT ?"
+        )
+        return [
+            dict(zip(COLUMNS, row))
+            for row in self._connection().execute(sql, [*params, limit])
+        ]
+
+    def _statistics(
+        self, team_id: str, start: int | None, end: int | None
+    ) -> dict[str, int]:
+        where, params = self._where(team_id, start, end)
+        sql = (
+            "SELECT COUNT(*), "
+            "COALESCE(SUM(own > other), 0), COALESCE(SUM(own <= other), 0), "
+            "COALESCE(SUM(own), 0), COALESCE(SUM(other), 0) "
+            "FROM (SELECT "
+            "CASE WHEN team1_id = ? THEN team1_sets ELSE team2_sets END AS own, "
+            "CASE WHEN team1_id = ? THEN team2_sets ELSE team1_sets END AS other "
+            f"FROM matches{where}) "
+            "WHERE own IS NOT NULL AND other IS NOT NULL"
+        )
+        row = self._connection().execute(sql, [team_id, team_id, *params]).fetchone()
+        return dict(zip(("played", "won", "lost", "sets_won", "sets_lost"), row))
+
+    async def async_open(self) -> None:
+        async with self._lock:
+            await self.hass.async_add_executor_job(self._open)
+
+    async def async_close(self) -> None:
+        async with self._lock:
+            await self.hass.async_add_executor_job(self._close)
+
+    async def async_add(self, rows: list[tuple]) -> None:
+        if not rows:
+            return
+        async with self._lock:
+            if self._conn is None:
+                return
+            await self.hass.async_add_executor_job(self._insert, rows)
+        _LOGGER.debug("Archived %d finished matches", len(rows))
+
+    async def async_query(
+        self,
+        team_id: str | None = None,
+        start: int | None = None,
+        end: int | None = None,
+        limit: int = 100,
+    ) -> list[dict[str, Any]]:
+        async with self._lock:
+            if self._conn is None:
+                return []
+            return await self.hass.async_add_executor_job(
+                self._query, team_id, start, end, limit
+            )
+
+    async def async_statistics(
+        self, team_id: str, start: int | None = None, end: int | None = None
+    ) -> dict[str, int]:
+        """Summarize won and lost matches and sets of a team over all matches."""
+        async with self._lock:
+            if self._conn is None:
+                return {}
+            return await self.hass.async_add_executor_job(
+                self._statistics, team_id, start, end
+            )
+
+
+async def async_setup_archive(hass: HomeAssistant) -> MatchArchive:
+    """Open the archive once, it is closed when Home Assistant stops."""
+    if DATA_ARCHIVE not in hass.data:
+        archive = MatchArchive(hass, hass.config.path(ARCHIVE_FILE))
+        hass.data[DATA_ARCHIVE] = archive
+        await archive.async_open()
+
+        async def _async_close(event: Event) -> None:
+            await archive.async_close()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_close)
+    return hass.data[DATA_ARCHIVE]
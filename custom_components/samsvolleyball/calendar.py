@@ -0,0 +1,168 @@
+"""The sams volleyball calendar platform."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import slugify
+
+from . import SamsDataCoordinator
+from .const import (
+    CALENDAR_EVENT_DURATION,
+    CONF_LEAGUE_NAME,
+    CONF_REGION,
+    CONF_TEAM_NAME,
+    DEFAULT_ICON,
+    DOMAIN,
+    NO_GAME,
+)
+from .fixtures import TeamFixtures
+from .utils import FINISHED, ID, NAME, TEAM, SamsIndex, SamsUtils
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the sams volleyball calendar platform."""
+    coordinator = hass.data[DOMAIN][entry.data[CONF_REGION]]
+    async_add_entities([SamsCalendar(coordinator, entry)])
+
+
+class SamsCalendar(CoordinatorEntity, CalendarEntity):
+    """Calendar with all fixtures of the tracked team."""
+
+    _attr_icon = DEFAULT_ICON
+
+    def __init__(self, coordinator: SamsDataCoordinator, entry: ConfigEntry) -> None:
+        """Initialize the calendar."""
+        super().__init__(coordinator, context=self.get_active_state)
+        self._coordinator = coordinator
+        self._name = entry.data[CONF_TEAM_NAME]
+        self._league_name = entry.data[CONF_LEAGUE_NAME]
+        self._attr_name = f"{self._name} Fixtures"
+        self._attr_unique_id = f"{slugify(self._name)}_{entry.entry_id}_calendar"
+        self._index: SamsIndex | None = None
+        self._fixtures: TeamFixtures | None = None
+        # availability of the last written state, the diff does not cover it
+        self._written_available: bool | None = None
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        if self._coordinator.index is not None:
+            self._handle_coordinator_update()
+
+    def get_active_state(self):
+        # the calendar does not need the websocket
+        return NO_GAME
+
+    def _find_team(self, index: SamsIndex) -> str | None:
+        uuid_list = index.get_uuids_by_name(self._name, self._league_name)
+        for team_id in uuid_list:
+            if index.get_matches(team_id):
+                return team_id
+        return uuid_list[0] if uuid_list else None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Take over the changed matches of a new full update."""
+        index = self._coordinator.index
+        if index is None or index is self._index:
+            # live update of a single match or a failed update - the fixtures
+            # are unchanged
+            self._async_write_availability()
+            return
+        changes = self._coordinator.changes
+        fixtures = self._fixtures
+        previous = self._index
+        self._index = index
+        if (
+            fixtures is not None
+            and previous is not None
+            and changes is not None
+            and index.get_team_by_id(fixtures.team_id)[0] is not None
+        ):
+            if fixtures.team_id not in changes.teams or not fixtures.apply(
+                index, changes.matches
+            ):
+                self._async_write_availability()
+                return
+        else:
+            team_id = self._find_team(index)
+            if team_id is None:
+                _LOGGER.warning(
+                    "No team data found for %s - %s", self._name, self._league_name
+                )
+                self._fixtures = None
+            else:
+                self._fixtures = TeamFixtures(team_id, index.get_matches(team_id))
+        super()._handle_coordinator_update()
+        self._written_available = self.available
+
+    @callback
+    def _async_write_availability(self) -> None:
+        """Write the state if only the availability changed."""
+        if self.available != self._written_available:
+            super()._handle_coordinator_update()
+            self._written_available = self.available
+
+    def _event(self, index: SamsIndex, match: dict) -> CalendarEvent:
+        team1, series = index.get_team_by_id(match[TEAM + "1"])
+        team2, _ = index.get_team_by_id(match[TEAM + "2"])
+        description = series[NAME] if series else None
+        match_state = SamsUtils.get_match_state(index.data, match[ID])
+        if match_state and match_state.get(FINISHED):
+            set_points = match_state.get("setPoints") or {}
+            sets = ", ".join(
+                f"{match_set['setScore']['team1']}:{match_set['setScore']['team2']}"
+                for match_set in match_state.get("matchSets") or []
+            )
+            description = (
+                f"{description}\n"
+                f"{set_points.get('team1')}:{set_points.get('team2')} ({sets})"
+            )
+        start = SamsUtils.date_from_match(match)
+        return CalendarEvent(
+            start=start,
+            end=start + timedelta(seconds=CALENDAR_EVENT_DURATION),
+            summary=(
+                f"{team1[NAME] if team1 else match[TEAM + '1']}"
+                f" - {team2[NAME] if team2 else match[TEAM + '2']}"
+            ),
+            description=description,
+            uid=match[ID],
+        )
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Return the running or next match."""
+        if not self._fixtures or self._index is None:
+            return None
+        matches = self._fixtures.between(
+            self._coordinator.now_ts() - CALENDAR_EVENT_DURATION
+        )
+        return self._event(self._index, matches[0]) if matches else None
+
+    async def async_get_events(
+        self, hass: HomeAssistant, start_date: datetime, end_date: datetime
+    ) -> list[CalendarEvent]:
+        """Return the matches overlapping the range."""
+        index = self._index
+        if not self._fixtures or index is None:
+            return []
+        return [
+            self._event(index, match)
+            for match in self._fixtures.between(
+                start_date.timestamp() - CALENDAR_EVENT_DURATION,
+                end_date.timestamp(),
+            )
+        ]
@@ -22,11 +22,13 @@ from .const import (
     CONF_GENDER_LIST,
     CONF_GENDER_MALE,
     CONF_GENDER_MIXED,
+    CONF_GET_URL,
     CONF_HOST,
     CONF_LEAGUE,
     CONF_LEAGUE_NAME,
     CONF_REGION,
     CONF_REGION_LIST,
+    CONF_SEARCH,
     CONF_TEAM_NAME,
     CONF_TEAM_UUID,
     CONFIG_ENTRY_VERSION,
@@ -34,6 +36,7 @@ from .const import (
     DOMAIN,
     URL_GET,
 )
+from .search import async_search_teams
 from .utils import SamsUtils
 
 _LOGGER = logging.getLogger(__name__)
@@ -41,6 +44,7 @@ _LOGGER = logging.getLogger(__name__)
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_HOST, default=DEFAULT_OPTIONS[CONF_HOST]): str,
+        vol.Required(CONF_GET_URL, default=URL_GET): str,
         vol.Required(
             CONF_REGION, default=DEFAULT_OPTIONS[CONF_REGION]
         ): selector.SelectSelector(
@@ -48,6 +52,7 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
                 options=CONF_REGION_LIST, translation_key=CONF_REGION
             ),
         ),
+        vol.Optional(CONF_SEARCH): str,
     }
 )
 
@@ -65,7 +70,7 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]):
     """
 
     url = urllib.parse.urljoin(data[CONF_HOST], data[CONF_REGION])
-    get_url = urllib.parse.urljoin(URL_GET, data[CONF_REGION])
+    get_url = urllib.parse.urljoin(data[CONF_GET_URL], data[CONF_REGION])
     session = async_get_clientsession(hass)
     coordinator = SamsDataCoordinator(hass, session, "ConfigValidate", url, get_url)
 
@@ -93,12 +98,37 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     leagues: dict[str, str] = {}
     teams: dict[str, str] = {}
 
+    def __init__(self) -> None:
+        """Init the flow."""
+        self.search_results: dict[str, dict[str, str]] = {}
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle the initial step."""
         errors: dict[str, str] = {}
-        if user_input is not None:
+        if user_input is not None and user_input.get(CONF_SEARCH):
+            results = await async_search_teams(
+                self.hass, user_input[CONF_GET_URL], user_input[CONF_SEARCH]
+            )
+            if results is None:
+                errors["base"] = "cannot_connect"
+            elif not results:
+                errors["base"] = "no_search_results"
+            else:
+                self.cfg_data = {
+                    CONF_HOST: user_input[CONF_HOST],
+                    CONF_GET_URL: user_input[CONF_GET_URL],
+                }
+                self.search_results = {
+                    "/".join(
+                        (team[CONF_REGION], team[CONF_LEAGUE], team[CONF_TEAM_UUID])
+                    ): team
+                    for team in results
+                }
+                return await self.async_step_search()
+        elif user_input is not None:
+            user_input.pop(CONF_SEARCH, None)
             try:
                 self.data, self.leagues = await validate_input(self.hass, user_input)
                 self.cfg_data = user_input
@@ -118,6 +148,42 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
         )
 
+    async def async_step_search(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle a config flow for samsvolleyball. Select a found team."""
+        if user_input is not None:
+            team = self.search_results[user_input[CONF_TEAM_NAME]]
+            self.cfg_data.update(
+                {
+                    CONF_REGION: team[CONF_REGION],
+                    CONF_GENDER: team[CONF_GENDER],
+                    CONF_LEAGUE: team[CONF_LEAGUE],
+                    CONF_LEAGUE_NAME: team[CONF_LEAGUE_NAME],
+                    CONF_TEAM_NAME: team[CONF_TEAM_NAME],
+                    CONF_TEAM_UUID: team[CONF_TEAM_UUID],
+                }
+            )
+            devicename = f"{team[CONF_TEAM_NAME]} ({team[CONF_LEAGUE_NAME]})"
+            return self.async_create_entry(title=devicename, data=self.cfg_data)
+
+        team_select = [
+            {
+                "label": f"{team[CONF_TEAM_NAME]} - {team[CONF_LEAGUE_NAME]}"
+                f" ({team[CONF_REGION]})",
+                "value": key,
+            }
+            for key, team in self.search_results.items()
+        ]
+        step_search_schema = vol.Schema(
+            {
+                vol.Required(CONF_TEAM_NAME): selector.SelectSelector(
+                    selector.SelectSelectorConfig(options=team_select)
+                )
+            }
+        )
+        return self.async_show_form(step_id="search", data_schema=step_search_schema)
+
     async def async_step_gender(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -4,9 +4,10 @@ from homeassistant.const import CONF_NAME, Platform
 
 # Misc
 DOMAIN = "samsvolleyball"
-PLATFORMS = [Platform.SENSOR]
+PLATFORMS = [Platform.CALENDAR, Platform.SENSOR]
 
 CONF_HOST = "host"
+CONF_GET_URL = "get_url"
 CONF_REGION = "region"
 CONF_LEAGUE = "league"
 CONF_GENDER = "gender"
@@ -15,6 +16,7 @@ CONF_GENDER_MALE = "MALE"
 CONF_GENDER_MIXED = "MIXED"
 CONF_LEAGUE_NAME = "league_name"
 
+CONF_SEARCH = "search"
 CONF_TEAM_NAME = "team"
 CONF_TEAM_UUID = "team_id"
 
@@ -71,17 +73,63 @@ LEAGUE_URL_LOGO_MAP = {
     "vvrp": "https://www.vvrp.de/cms/files/VVRP_Dateien/layout/logos/Logo_VVRP.svg",
 }
 
+# full ticker json larger than this is decoded and indexed in an executor
+INGEST_EXECUTOR_THRESHOLD = 256 * 1024  # bytes
+
+LOGO_URL = f"/api/{DOMAIN}/logo/{{key}}"
+LOGO_CACHE_DIR = f"{DOMAIN}_logo_cache"
+LOGO_CACHE_MAX_BYTES = 20 * 1024 * 1024  # 20 MB
+LOGO_REVALIDATE = 24 * 60 * 60  # 1 day
+
+ARCHIVE_FILE = f"{DOMAIN}_archive.db"
+
 TIMEOUT_PERIOD_CHECK = 30  # 30 sec.
 NO_GAME = 0
 NEAR_GAME = 1
 IN_GAME = 2
 
+# a game is nearby from 2 hours before until 3 hours after kickoff
+NEAR_GAME_BEFORE = 2 * 60 * 60
+NEAR_GAME_AFTER = 3 * 60 * 60
+
+# assumed length of a match in the calendar
+CALENDAR_EVENT_DURATION = 2 * 60 * 60
+
 TIMEOUT = {
     NO_GAME: 2 * 60 * 60,  # 2h
     NEAR_GAME: 12 * 60,  # 12 min.
     IN_GAME: 5 * 60,  # 5 min.
 }
 
+TIMELINE_MAX_SETS = 5
+TIMELINE_RALLIES_PER_SET = 128
+TIMELINE_RETENTION = 2 * 60 * 60  # 2h after the match finished
+
+# team search across all associations of the config flow
+SEARCH_PARALLEL = 4
+SEARCH_CACHE_TTL = 10 * 60  # 10 min.
+SEARCH_MAX_RESULTS = 50
+
+SERVICE_GET_MATCH_TIMELINE = "get_match_timeline"
+SERVICE_SET_PROFILING = "set_profiling"
+SERVICE_CAPTURE_PROFILE = "capture_profile"
+SERVICE_MEMORY_REPORT = "memory_report"
+SERVICE_GET_MATCH_HISTORY = "get_match_history"
+ATTR_MATCH_ID = "match_id"
+ATTR_ENABLED = "enabled"
+ATTR_BUDGET_MS = "budget_ms"
+ATTR_DURATION = "duration"
+ATTR_TRACEMALLOC_TOP = "tracemalloc_top"
+ATTR_TEAM_ID = "team_id"
+ATTR_START = "start"
+ATTR_END = "end"
+ATTR_LIMIT = "limit"
+
+EVENT_MATCH_STARTED = f"{DOMAIN}_match_started"
+EVENT_MATCH_FINISHED = f"{DOMAIN}_match_finished"
+EVENT_POINT_SCORED = f"{DOMAIN}_point_scored"
+EVENT_SET_WON = f"{DOMAIN}_set_won"
+
 DEFAULT_ICON = "mdi:volleyball"
 VOLLEYBALL = "volleyball"
 
@@ -94,6 +142,13 @@ STATES_NOT_FOUND = "NOT_FOUND"
 STATES_PRE = "PRE"
 STATES_POST = "POST"
 
+GET_HEADERS = {
+    "Accept-Encoding": "gzip, deflate",
+}
+
+# window bits for permessage-deflate, 0 disables compression
+WS_COMPRESS = 15
+
 HEADERS = {
     "Connection": "Upgrade",
     "Pragma": "no-cache",
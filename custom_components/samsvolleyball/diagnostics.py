@@ -0,0 +1,32 @@
+"""Diagnostics support for the sams-volleyball integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_REGION, DOMAIN
+from .memory import coordinator_report
+from .profiling import PROFILER
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data[DOMAIN][entry.data[CONF_REGION]]
+    return {
+        "entry": dict(entry.data),
+        "coordinator": {
+            "name": coordinator.name,
+            "connected": coordinator.connected,
+            "update_interval": str(coordinator.update_interval),
+            "last_get_ts": coordinator.last_get_ts,
+            "last_ws_receive_ts": coordinator.last_ws_receive_ts,
+        },
+        "transfer": dict(coordinator.stats),
+        "profiling": PROFILER.as_dict(),
+        "memory": coordinator_report(coordinator),
+    }
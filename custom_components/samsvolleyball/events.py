@@ -0,0 +1,87 @@
+"""Detect transitions between two states of a match to fire compact events."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from .const import (
+    EVENT_MATCH_FINISHED,
+    EVENT_MATCH_STARTED,
+    EVENT_POINT_SCORED,
+    EVENT_SET_WON,
+)
+
+TEAMS = ("team1", "team2")
+
+
+def _set_by_number(match_state: dict, set_number) -> dict | None:
+    for match_set in match_state.get("matchSets") or []:
+        if match_set["setNumber"] == set_number:
+            return match_set
+    return None
+
+
+def diff_match_states(
+    previous: dict | None, current: dict
+) -> list[tuple[str, dict[str, Any]]]:
+    """Return the events between two match states as (event_type, data) tuples.
+
+    Without a previous state nothing is reported - a match already running when
+    we start to listen must not fire a burst of events.
+    """
+    events: list[tuple[str, dict[str, Any]]] = []
+    if previous is None or previous == current:
+        return events
+
+    if current.get("started") and not previous.get("started"):
+        events.append((EVENT_MATCH_STARTED, {}))
+
+    # a frame can complete a set and open the next one - diff all of them
+    for cur_set in current.get("matchSets") or []:
+        prev_set = _set_by_number(previous, cur_set["setNumber"])
+        for team in TEAMS:
+            score = cur_set["setScore"][team]
+            prev_score = prev_set["setScore"][team] if prev_set else 0
+            if score > prev_score:
+                events.append(
+                    (
+                        EVENT_POINT_SCORED,
+                        {
+                            "team_num": team,
+                            "set_number": cur_set["setNumber"],
+                            "score": dict(cur_set["setScore"]),
+                        },
+                    )
+                )
+
+    prev_points = previous.get("setPoints") or {}
+    cur_points = current.get("setPoints") or {}
+    for team in TEAMS:
+        if cur_points.get(team, 0) > prev_points.get(team, 0):
+            # the number of the won set equals the number of completed sets
+            set_number = sum(cur_points.values())
+            won_set = _set_by_number(current, set_number)
+            events.append(
+                (
+                    EVENT_SET_WON,
+                    {
+                        "team_num": team,
+                        "set_number": set_number,
+                        "score": dict(won_set["setScore"]) if won_set else None,
+                        "set_points": dict(cur_points),
+                    },
+                )
+            )
+
+    if current.get("finished") and not previous.get("finished"):
+        winner = None
+        if cur_points.get("team1", 0) != cur_points.get("team2", 0):
+            winner = max(TEAMS, key=lambda team: cur_points.get(team, 0))
+        events.append(
+            (
+                EVENT_MATCH_FINISHED,
+                {"winner_num": winner, "set_points": dict(cur_points)},
+            )
+        )
+
+    return events
@@ -0,0 +1,63 @@
+"""Matches of a team sorted by kickoff for the range queries of the calendar."""
+
+from __future__ import annotations
+
+import bisect
+from collections.abc import Iterable
+
+from .utils import DATE, ID, TEAM, SamsIndex
+
+
+def _kickoff_ts(match: dict) -> float:
+    return float(match[DATE]) / 1000
+
+
+class TeamFixtures:
+    """Fixtures of one team, sorted by kickoff.
+
+    Kept up to date with the change-set of the full updates instead of
+    scanning all matchdays of the region, range queries are a bisect.
+    """
+
+    __slots__ = ("_keys", "_matches", "team_id")
+
+    def __init__(self, team_id: str, matches: Iterable[dict] = ()) -> None:
+        """Init the fixtures with the matches of the team."""
+        self.team_id = team_id
+        self._matches = {match[ID]: match for match in matches}
+        self._keys = sorted(
+            (_kickoff_ts(match), match_id) for match_id, match in self._matches.items()
+        )
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _remove(self, match_id: str) -> bool:
+        match = self._matches.pop(match_id, None)
+        if match is None:
+            return False
+        key = (_kickoff_ts(match), match_id)
+        del self._keys[bisect.bisect_left(self._keys, key)]
+        return True
+
+    def apply(self, index: SamsIndex, match_ids: Iterable[str]) -> bool:
+        """Take over the changed matches of a new index, True if any was ours."""
+        changed = False
+        for match_id in match_ids:
+            changed |= self._remove(match_id)
+            match = index.get_match(match_id)
+            if match and self.team_id in (match[TEAM + "1"], match[TEAM + "2"]):
+                self._matches[match_id] = match
+                bisect.insort(self._keys, (_kickoff_ts(match), match_id))
+                changed = True
+        return changed
+
+    def between(self, start_ts: float, end_ts: float | None = None) -> list[dict]:
+        """Return the matches with kickoff from start_ts until before end_ts."""
+        lo = bisect.bisect_left(self._keys, (start_ts,))
+        hi = (
+            len(self._keys)
+            if end_ts is None
+            else bisect.bisect_left(self._keys, (end_ts,), lo)
+        )
+        return [self._matches[match_id] for _, match_id in self._keys[lo:hi]]
@@ -0,0 +1,216 @@
+"""Local caching proxy for team and league logos."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+import hashlib
+import json
+import logging
+import os
+import time
+
+from aiohttp import ClientError, hdrs, web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import (
+    DOMAIN,
+    LOGO_CACHE_DIR,
+    LOGO_CACHE_MAX_BYTES,
+    LOGO_REVALIDATE,
+    LOGO_URL,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_LOGO_CACHE = f"{DOMAIN}_logo_cache"
+
+# logos are served from the origin of Home Assistant - never let a remote
+# file (e.g. an svg with script) run in it when it is opened directly
+LOGO_HEADERS = {
+    hdrs.CACHE_CONTROL: f"public, max-age={LOGO_REVALIDATE}",
+    "Content-Security-Policy": "default-src 'none'; style-src 'unsafe-inline'; sandbox",
+    "X-Content-Type-Options": "nosniff",
+}
+
+
+class LogoCache:
+    """Size bounded on-disk LRU cache of remote logos.
+
+    Only urls handed out by proxy_url() are served, their mapping is kept next
+    to the cached files. Entries older than LOGO_REVALIDATE are revalidated
+    with a conditional request.
+    """
+
+    def __init__(self, hass: HomeAssistant, path: str) -> None:
+        """Init the cache - call async_load() before use."""
+        self.hass = hass
+        self.path = path
+        self._urls: dict[str, str] = {}
+        self._keys: dict[str, str] = {}
+        self._lru: OrderedDict[str, int] = OrderedDict()
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    def _load(self) -> list[tuple[str, int, str]]:
+        os.makedirs(self.path, exist_ok=True)
+        entries = []
+        for name in os.listdir(self.path):
+            if name.endswith(".json"):
+                continue
+            try:
+                stat = os.stat(self._file(name))
+                with open(self._file(name) + ".json", encoding="utf-8") as file:
+                    url = json.load(file)["url"]
+            except (OSError, ValueError, KeyError):
+                continue
+            entries.append((stat.st_mtime, name, stat.st_size, url))
+        return [(name, size, url) for _, name, size, url in sorted(entries)]
+
+    async def async_load(self) -> None:
+        """Take over the cached logos, they are served before the next update."""
+        for key, size, url in await self.hass.async_add_executor_job(self._load):
+            self._lru[key] = size
+            self._urls[key] = url
+            self._keys[url] = key
+
+    @callback
+    def proxy_url(self, url: str | None) -> str | None:
+        """Return the local url serving the logo."""
+        if not url or url.startswith(LOGO_URL.split("{", maxsplit=1)[0]):
+            return url
+        if url not in self._keys:
+            key = hashlib.sha256(url.encode()).hexdigest()[:32]
+            self._keys[url] = key
+            self._urls[key] = url
+        return LOGO_URL.format(key=self._keys[url])
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self.path, key)
+
+    def _read(self, key: str) -> tuple[bytes, dict] | None:
+        try:
+            with open(self._file(key), "rb") as file:
+                body = file.read()
+            with open(self._file(key) + ".json", encoding="utf-8") as file:
+                meta = json.load(file)
+        except (OSError, ValueError):
+            return None
+        return body, meta
+
+    def _write(self, key: str, body: bytes | None, meta: dict) -> None:
+        if body is not None:
+            with open(self._file(key), "wb") as file:
+                file.write(body)
+        else:
+            # revalidated - mark as recently used
+            os.utime(self._file(key))
+        with open(self._file(key) + ".json", "w", encoding="utf-8") as file:
+            json.dump(meta, file)
+
+    def _remove(self, keys: list[str]) -> None:
+        for key in keys:
+            for name in (self._file(key), self._file(key) + ".json"):
+                try:
+                    os.remove(name)
+                except OSError:
+                    pass
+
+    async def _async_evict(self) -> None:
+        evicted = []
+        while sum(self._lru.values()) > LOGO_CACHE_MAX_BYTES and len(self._lru) > 1:
+            key, _ = self._lru.popitem(last=False)
+            evicted.append(key)
+        if evicted:
+            _LOGGER.debug("Evict %d logos from cache", len(evicted))
+            await self.hass.async_add_executor_job(self._remove, evicted)
+
+    async def async_get(self, key: str) -> tuple[bytes, str] | None:
+        """Return body and content type of a logo, fetch or revalidate if needed."""
+        url = self._urls.get(key)
+        if url is None:
+            return None
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            cached = None
+            if key in self._lru:
+                cached = await self.hass.async_add_executor_job(self._read, key)
+            if cached and time.time() - cached[1]["fetched"] < LOGO_REVALIDATE:
+                self._lru.move_to_end(key)
+                return cached[0], cached[1]["content_type"]
+            return await self._async_fetch(key, url, cached)
+
+    async def _async_fetch(
+        self, key: str, url: str, cached: tuple[bytes, dict] | None
+    ) -> tuple[bytes, str] | None:
+        headers = {}
+        if cached:
+            if cached[1].get("etag"):
+                headers[hdrs.IF_NONE_MATCH] = cached[1]["etag"]
+            if cached[1].get("last_modified"):
+                headers[hdrs.IF_MODIFIED_SINCE] = cached[1]["last_modified"]
+        session = async_get_clientsession(self.hass)
+        try:
+            async with session.get(url, headers=headers) as resp:
+                if resp.status == 304 and cached:
+                    body, meta = cached[0], {**cached[1], "fetched": time.time()}
+                    revalidated = True
+                else:
+                    resp.raise_for_status()
+                    if not resp.content_type.startswith("image/"):
+                        raise ClientError(f"no image but {resp.content_type}")
+                    body = await resp.read()
+                    meta = {
+                        "url": url,
+                        "etag": resp.headers.get(hdrs.ETAG),
+                        "last_modified": resp.headers.get(hdrs.LAST_MODIFIED),
+                        "content_type": resp.content_type,
+                        "fetched": time.time(),
+                    }
+                    revalidated = False
+        except (TimeoutError, ClientError) as exc:
+            _LOGGER.debug("Cannot fetch logo %s: %s", url, exc)
+            # serve the stale logo rather than nothing
+            return (cached[0], cached[1]["content_type"]) if cached else None
+        await self.hass.async_add_executor_job(
+            self._write, key, None if revalidated else body, meta
+        )
+        self._lru[key] = len(body)
+        self._lru.move_to_end(key)
+        await self._async_evict()
+        return body, meta["content_type"]
+
+
+class SamsLogoView(HomeAssistantView):
+    """Serve cached logos.
+
+    No authentication, as the logos are used in img tags of the dashboards -
+    only the public logo urls registered by the integration are served.
+    """
+
+    url = LOGO_URL
+    name = f"api:{DOMAIN}:logo"
+    requires_auth = False
+
+    def __init__(self, cache: LogoCache) -> None:
+        """Init the view."""
+        self.cache = cache
+
+    async def get(self, request: web.Request, key: str) -> web.Response:
+        result = await self.cache.async_get(key)
+        if result is None:
+            return web.Response(status=404)
+        body, content_type = result
+        return web.Response(body=body, content_type=content_type, headers=LOGO_HEADERS)
+
+
+async def async_setup_logo_cache(hass: HomeAssistant) -> LogoCache:
+    """Set up the logo cache and its view once."""
+    if DATA_LOGO_CACHE not in hass.data:
+        cache = LogoCache(hass, hass.config.path(LOGO_CACHE_DIR))
+        hass.data[DATA_LOGO_CACHE] = cache
+        await cache.async_load()
+        hass.http.register_view(SamsLogoView(cache))
+    return hass.data[DATA_LOGO_CACHE]
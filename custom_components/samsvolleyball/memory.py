@@ -0,0 +1,105 @@
+"""Memory footprint report of the region coordinators and their sensors."""
+
+from __future__ import annotations
+
+import os
+import sys
+import tracemalloc
+from typing import Any
+
+_PACKAGE_DIR = os.path.dirname(__file__)
+
+
+def deep_sizeof(obj: Any, seen: set[int] | None = None) -> int:
+    """Return the size of an object including everything it references.
+
+    Objects already in seen are not counted again, so sharing a seen set
+    between calls reports the additional memory of each object.
+    """
+    if seen is None:
+        seen = set()
+    size = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif hasattr(item, "__slots__"):
+            stack.extend(
+                getattr(item, slot) for slot in item.__slots__ if hasattr(item, slot)
+            )
+        elif hasattr(item, "items") and hasattr(item, "keys"):
+            # mapping proxies of the index
+            stack.extend(item.keys())
+            stack.extend(item.values())
+    return size
+
+
+def _entity_report(entity: Any, seen: set[int]) -> dict[str, int]:
+    return {
+        attr: deep_sizeof(getattr(entity, attr, None), seen)
+        for attr in ("_ticker_data", "_match_data", "_attr", "_fixtures")
+    }
+
+
+def coordinator_report(coordinator: Any) -> dict[str, Any]:
+    """Report the deep sizes held by a coordinator and its listening entities.
+
+    Shared data (e.g. the overview referenced by all sensors) is counted only
+    at the first place it is found.
+    """
+    seen: set[int] = set()
+    overview = coordinator.index.data if coordinator.index else None
+    report: dict[str, Any] = {
+        "overview": deep_sizeof(overview, seen),
+        "index": deep_sizeof(coordinator.index, seen),
+        "data": deep_sizeof(coordinator.data, seen),
+        "buffers": {
+            name: deep_sizeof(buffer, seen)
+            for name, buffer in coordinator.buffers().items()
+        },
+        "entities": {
+            entity.entity_id or entity.name: _entity_report(entity, seen)
+            for entity in coordinator.listener_entities()
+        },
+    }
+    report["total"] = (
+        report["overview"]
+        + report["index"]
+        + report["data"]
+        + sum(report["buffers"].values())
+        + sum(sum(sizes.values()) for sizes in report["entities"].values())
+    )
+    return report
+
+
+def tracemalloc_report(top: int) -> dict[str, Any]:
+    """Return the top allocations of the integration modules.
+
+    Tracing is started on the first request - allocations are only visible
+    from then on. A top of 0 stops tracing.
+    """
+    if top <= 0:
+        tracemalloc.stop()
+        return {"tracing": False}
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+        return {"tracing": True, "started": True, "top": []}
+    snapshot = tracemalloc.take_snapshot().filter_traces(
+        (tracemalloc.Filter(True, os.path.join(_PACKAGE_DIR, "*")),)
+    )
+    return {
+        "tracing": True,
+        "started": False,
+        "top": [
+            {"location": str(stat.traceback), "size": stat.size, "count": stat.count}
+            for stat in snapshot.statistics("lineno")[:top]
+        ],
+    }
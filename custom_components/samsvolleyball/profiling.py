@@ -0,0 +1,132 @@
+"""Opt-in instrumentation of the hot paths of the integration."""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import cProfile
+from collections.abc import Callable
+import functools
+import logging
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+# upper bounds of the histogram buckets in seconds, the last bucket is open
+HISTOGRAM_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+DEFAULT_SLOW_BUDGET = 0.05  # 50 ms
+
+
+class HotPathProfiler:
+    """Duration histograms per hot path and logging of slow calls."""
+
+    def __init__(self) -> None:
+        """Init a disabled profiler."""
+        self.enabled = False
+        self.budget = DEFAULT_SLOW_BUDGET
+        self.histograms: dict[str, list[int]] = {}
+        self.totals: dict[str, list[float]] = {}
+        self._cprofile_lock = asyncio.Lock()
+
+    def configure(self, enabled: bool, budget: float | None = None) -> None:
+        self.enabled = enabled
+        if budget is not None:
+            self.budget = budget
+        if enabled:
+            self.histograms.clear()
+            self.totals.clear()
+        _LOGGER.info(
+            "Hot path profiling %s (budget %.1f ms)",
+            "enabled" if enabled else "disabled",
+            self.budget * 1000,
+        )
+
+    def record(
+        self, name: str, duration: float, region: str, match_id: str | None
+    ) -> None:
+        histogram = self.histograms.setdefault(name, [0] * (len(HISTOGRAM_BUCKETS) + 1))
+        histogram[bisect.bisect_left(HISTOGRAM_BUCKETS, duration)] += 1
+        totals = self.totals.setdefault(name, [0, 0.0, 0.0])
+        totals[0] += 1
+        totals[1] += duration
+        totals[2] = max(totals[2], duration)
+        if duration > self.budget:
+            _LOGGER.warning(
+                "Slow call %s took %.1f ms - region %s, match %s",
+                name,
+                duration * 1000,
+                region,
+                match_id,
+            )
+
+    def as_dict(self) -> dict:
+        buckets = [f"<={bound * 1000:g}ms" for bound in HISTOGRAM_BUCKETS]
+        buckets.append(f">{HISTOGRAM_BUCKETS[-1] * 1000:g}ms")
+        return {
+            "enabled": self.enabled,
+            "budget_ms": self.budget * 1000,
+            "calls": {
+                name: {
+                    "count": totals[0],
+                    "mean_ms": totals[1] / totals[0] * 1000 if totals[0] else 0,
+                    "max_ms": totals[2] * 1000,
+                    "histogram": dict(zip(buckets, self.histograms[name])),
+                }
+                for name, totals in self.totals.items()
+            },
+        }
+
+    async def async_capture(self, duration: float) -> cProfile.Profile:
+        """Profile the event loop thread for the given time window."""
+        async with self._cprofile_lock:
+            profile = cProfile.Profile()
+            profile.enable()
+            try:
+                await asyncio.sleep(duration)
+            finally:
+                profile.disable()
+            return profile
+
+
+PROFILER = HotPathProfiler()
+
+
+def profiled(name: str) -> Callable:
+    """Decorate a hot path method of an object providing profile_context().
+
+    profile_context() returns region and match id and is evaluated after the
+    call, so it can report the match processed by the call.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                if not PROFILER.enabled:
+                    return await func(self, *args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return await func(self, *args, **kwargs)
+                finally:
+                    PROFILER.record(
+                        name, time.perf_counter() - start, *self.profile_context()
+                    )
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if not PROFILER.enabled:
+                return func(self, *args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                PROFILER.record(
+                    name, time.perf_counter() - start, *self.profile_context()
+                )
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,250 @@
+"""Local relay to share one upstream SAMS connection between several instances.
+
+The relay serves the same paths as the SAMS backend, so an installation only
+needs to point the host and ticker url of the config entry to it:
+
+    python custom_components/samsvolleyball/relay.py --port 8765
+
+    host:       ws://<relay>:8765/indoor/
+    ticker url: http://<relay>:8765/live/indoor/tickers/
+
+Per region it holds at most one upstream WebSocket (as long as local clients
+are connected), caches the full ticker json and fans all frames out to the
+local clients.
+
+The relay only needs aiohttp. It does not import the integration, so it runs
+on hosts without Home Assistant.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+if __name__ == "__main__":
+    # run as a script, the modules of the integration (calendar, ...) must
+    # not shadow the standard library
+    _HERE = os.path.dirname(os.path.abspath(__file__))
+    sys.path[:] = [path for path in sys.path if os.path.abspath(path) != _HERE]
+
+import argparse
+import asyncio
+import logging
+import time
+import urllib.parse
+from collections.abc import AsyncIterator
+
+from aiohttp import ClientError, ClientSession, WSMsgType, web
+
+_LOGGER = logging.getLogger(__name__)
+
+# same values as in const.py, which can not be imported without homeassistant
+URL_WS = "wss://backend.sams-ticker.de/indoor/"
+URL_GET = "https://backend.sams-ticker.de/live/indoor/tickers/"
+REGION_LIST = (
+    "baden",
+    "bvv",
+    "dvv",
+    "flvb",
+    "hvbv",
+    "hvv",
+    "nwvv",
+    "shvv",
+    "ssvb",
+    "svv",
+    "tvv",
+    "vbl",
+    "vmv",
+    "vlw",
+    "vvb",
+    "vvrp",
+)
+GET_HEADERS = {
+    "Accept-Encoding": "gzip, deflate",
+}
+WS_COMPRESS = 15
+HEADERS = {
+    "Connection": "Upgrade",
+    "Pragma": "no-cache",
+    "Cache-Control": "no-cache",
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/129.0.0.0 Safari/537.36",
+    "Upgrade": "websocket",
+    "Accept-Encoding": "gzip, deflate, br, zstd",
+    "Accept-Language": "de-DE,de;q=0.9,en-US;q=0.8,en;q=0.7",
+}
+
+CACHE_TTL = 60  # sec.
+RECONNECT_DELAY = 5  # sec.
+RECONNECT_DELAY_MAX = 5 * 60  # 5 min.
+
+APP_UPSTREAMS = web.AppKey("upstreams", dict)
+APP_SESSION = web.AppKey("session", ClientSession)
+
+
+class RegionUpstream:
+    """One upstream connection and overview cache for a sams region."""
+
+    def __init__(
+        self,
+        session: ClientSession,
+        region: str,
+        ws_base: str,
+        get_base: str,
+        cache_ttl: float = CACHE_TTL,
+    ) -> None:
+        """Init the upstream of a region - connections are opened on demand."""
+        self.session = session
+        self.region = region
+        self.ws_url = urllib.parse.urljoin(ws_base, region)
+        self.get_url = urllib.parse.urljoin(get_base, region)
+        self.cache_ttl = cache_ttl
+        self.clients: set[web.WebSocketResponse] = set()
+        self._overview: bytes | None = None
+        self._overview_ts = 0.0
+        self._get_lock = asyncio.Lock()
+        self._ws_task: asyncio.Task | None = None
+
+    async def get_overview(self) -> bytes:
+        """Return the cached full ticker json, fetch it if outdated."""
+        async with self._get_lock:
+            if self._overview is None or (
+                time.monotonic() - self._overview_ts > self.cache_ttl
+            ):
+                resp = await self.session.get(
+                    self.get_url, headers=GET_HEADERS, raise_for_status=True
+                )
+                self._overview = await resp.read()
+                self._overview_ts = time.monotonic()
+                _LOGGER.debug(
+                    "%s - fetched overview (%d bytes)", self.region, len(self._overview)
+                )
+            return self._overview
+
+    def add_client(self, ws: web.WebSocketResponse) -> None:
+        self.clients.add(ws)
+        if self._ws_task is None or self._ws_task.done():
+            self._ws_task = asyncio.get_running_loop().create_task(self._run())
+
+    def remove_client(self, ws: web.WebSocketResponse) -> None:
+        self.clients.discard(ws)
+        if not self.clients and self._ws_task is not None:
+            self._ws_task.cancel()
+            self._ws_task = None
+
+    async def _broadcast(self, data: str) -> None:
+        clients = list(self.clients)
+        results = await asyncio.gather(
+            *(client.send_str(data) for client in clients), return_exceptions=True
+        )
+        for client, result in zip(clients, results):
+            if isinstance(result, Exception):
+                _LOGGER.debug("%s - drop client: %s", self.region, result)
+                self.clients.discard(client)
+
+    async def _run(self) -> None:
+        delay = RECONNECT_DELAY
+        while self.clients:
+            try:
+                async with self.session.ws_connect(
+                    self.ws_url, headers=HEADERS, compress=WS_COMPRESS
+                ) as upstream:
+                    _LOGGER.info("%s - upstream connected", self.region)
+                    delay = RECONNECT_DELAY
+                    async for msg in upstream:
+                        if msg.type == WSMsgType.TEXT:
+                            await self._broadcast(msg.data)
+                        elif msg.type in (WSMsgType.CLOSED, WSMsgType.ERROR):
+                            break
+            except (TimeoutError, ClientError) as exc:
+                _LOGGER.warning("%s - upstream error: %s", self.region, exc)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("%s - unexpected upstream error", self.region)
+            if self.clients:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, RECONNECT_DELAY_MAX)
+        _LOGGER.info("%s - no clients left - upstream closed", self.region)
+
+    async def close(self) -> None:
+        if self._ws_task is not None:
+            self._ws_task.cancel()
+            self._ws_task = None
+        for client in list(self.clients):
+            await client.close()
+        self.clients.clear()
+
+
+def _get_upstream(request: web.Request) -> RegionUpstream:
+    region = request.match_info["region"]
+    if region not in REGION_LIST:
+        raise web.HTTPNotFound
+    return request.app[APP_UPSTREAMS][region]
+
+
+async def handle_get(request: web.Request) -> web.Response:
+    upstream = _get_upstream(request)
+    try:
+        body = await upstream.get_overview()
+    except (TimeoutError, ClientError) as exc:
+        raise web.HTTPBadGateway(text=str(exc)) from exc
+    return web.Response(body=body, content_type="application/json")
+
+
+async def handle_ws(request: web.Request) -> web.WebSocketResponse:
+    upstream = _get_upstream(request)
+    ws = web.WebSocketResponse(compress=True)
+    await ws.prepare(request)
+    upstream.add_client(ws)
+    try:
+        async for _ in ws:
+            # clients do not send anything relevant
+            pass
+    finally:
+        upstream.remove_client(ws)
+    return ws
+
+
+def create_app(
+    ws_base: str = URL_WS,
+    get_base: str = URL_GET,
+    cache_ttl: float = CACHE_TTL,
+) -> web.Application:
+    """Create the relay application with paths mirroring the SAMS backend."""
+    app = web.Application()
+
+    async def _upstreams(app: web.Application) -> AsyncIterator[None]:
+        app[APP_SESSION] = ClientSession()
+        app[APP_UPSTREAMS] = {
+            region: RegionUpstream(
+                app[APP_SESSION], region, ws_base, get_base, cache_ttl
+            )
+            for region in REGION_LIST
+        }
+        yield
+        for upstream in app[APP_UPSTREAMS].values():
+            await upstream.close()
+        await app[APP_SESSION].close()
+
+    app.cleanup_ctx.append(_upstreams)
+    app.router.add_get("/live/indoor/tickers/{region}", handle_get)
+    app.router.add_get("/indoor/{region}", handle_ws)
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Sams ticker relay")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--ws-base", default=URL_WS)
+    parser.add_argument("--get-base", default=URL_GET)
+    parser.add_argument("--cache-ttl", type=float, default=CACHE_TTL)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    web.run_app(
+        create_app(args.ws_base, args.get_base, args.cache_ttl),
+        host=args.host,
+        port=args.port,
+    )
+
+
+if __name__ == "__main__":
+    main()
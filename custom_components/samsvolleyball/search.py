@@ -0,0 +1,138 @@
+"""Team search across the catalogues of all associations."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import re
+import time
+import unicodedata
+import urllib.parse
+
+from aiohttp import ClientError
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import (
+    CONF_GENDER,
+    CONF_LEAGUE,
+    CONF_LEAGUE_NAME,
+    CONF_REGION,
+    CONF_REGION_LIST,
+    CONF_TEAM_NAME,
+    CONF_TEAM_UUID,
+    DOMAIN,
+    GET_HEADERS,
+    INGEST_EXECUTOR_THRESHOLD,
+    SEARCH_CACHE_TTL,
+    SEARCH_MAX_RESULTS,
+    SEARCH_PARALLEL,
+)
+from .utils import CLASS, CLASS_LEAGUE, GENDER, ID, MATCHSERIES, NAME, TEAMS, SamsUtils
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_SEARCH_CACHE = f"{DOMAIN}_search_cache"
+
+_NON_WORD = re.compile(r"\W+")
+
+
+def normalize(text: str) -> str:
+    """Return text casefolded, without accents and punctuation."""
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    return " ".join(_NON_WORD.sub(" ", text.casefold()).split())
+
+
+def build_catalogue(region: str, data: dict) -> list[dict[str, str]]:
+    """Return the teams of all leagues of an overview with their search key."""
+    catalogue: list[dict[str, str]] = []
+    if not SamsUtils.is_overview(data):
+        return catalogue
+    for league_id, series in data[MATCHSERIES].items():
+        if series[CLASS] != CLASS_LEAGUE:
+            continue
+        for team in series[TEAMS]:
+            catalogue.append(
+                {
+                    "key": normalize(f"{team[NAME]} {series[NAME]}"),
+                    CONF_REGION: region,
+                    CONF_GENDER: series[GENDER],
+                    CONF_LEAGUE: league_id,
+                    CONF_LEAGUE_NAME: series[NAME],
+                    CONF_TEAM_NAME: team[NAME],
+                    CONF_TEAM_UUID: team[ID],
+                }
+            )
+    return catalogue
+
+
+async def _async_fetch_overview(hass: HomeAssistant, url: str) -> dict:
+    """Fetch and decode the full ticker json of a region."""
+    session = async_get_clientsession(hass)
+    async with session.get(url, headers=GET_HEADERS, raise_for_status=True) as resp:
+        body = await resp.read()
+    if len(body) > INGEST_EXECUTOR_THRESHOLD:
+        return await hass.async_add_executor_job(json.loads, body)
+    return json.loads(body)
+
+
+async def _async_get_catalogue(
+    hass: HomeAssistant,
+    get_url: str,
+    region: str,
+    semaphore: asyncio.Semaphore,
+) -> list[dict[str, str]] | None:
+    cache = hass.data.setdefault(DATA_SEARCH_CACHE, {})
+    cached = cache.get((get_url, region))
+    if cached and time.monotonic() - cached[0] < SEARCH_CACHE_TTL:
+        return cached[1]
+
+    coordinator = hass.data.get(DOMAIN, {}).get(region)
+    if coordinator is not None and coordinator.index is not None:
+        data = coordinator.index.data
+    else:
+        async with semaphore:
+            try:
+                data = await _async_fetch_overview(
+                    hass, urllib.parse.urljoin(get_url, region)
+                )
+            except (TimeoutError, ClientError, ValueError) as exc:
+                _LOGGER.debug("Cannot search region %s: %s", region, exc)
+                return None
+
+    catalogue = build_catalogue(region, data) if data else []
+    cache[(get_url, region)] = (time.monotonic(), catalogue)
+    return catalogue
+
+
+async def async_search_teams(
+    hass: HomeAssistant, get_url: str, query: str
+) -> list[dict[str, str]] | None:
+    """Return the teams of all associations matching every word of the query.
+
+    The catalogues are fetched with bounded parallelism, running coordinators
+    and recently fetched catalogues are reused. None if no region answered.
+    """
+    semaphore = asyncio.Semaphore(SEARCH_PARALLEL)
+    catalogues = await asyncio.gather(
+        *(
+            _async_get_catalogue(hass, get_url, region, semaphore)
+            for region in CONF_REGION_LIST
+        )
+    )
+    if all(catalogue is None for catalogue in catalogues):
+        return None
+
+    words = normalize(query).split()
+    results = [
+        team
+        for catalogue in catalogues
+        if catalogue
+        for team in catalogue
+        if all(word in team["key"] for word in words)
+    ]
+    results.sort(key=lambda team: (team[CONF_TEAM_NAME], team[CONF_LEAGUE_NAME]))
+    return results[:SEARCH_MAX_RESULTS]
@@ -6,13 +6,14 @@ import locale
 import logging
 from typing import Any
 
+from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_ATTRIBUTION
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.util import dt as dt_util, slugify, timedelta
+from homeassistant.util import slugify, timedelta
 
 from . import SamsDataCoordinator
 from .const import (
@@ -28,13 +29,18 @@ from .const import (
     IN_GAME,
     LEAGUE_URL_LOGO_MAP,
     NEAR_GAME,
+    NEAR_GAME_AFTER,
+    NEAR_GAME_BEFORE,
     NO_GAME,
     STATES_IN,
     STATES_NOT_FOUND,
+    STATES_POST,
     TIMEOUT_PERIOD_CHECK,
     VOLLEYBALL,
 )
-from .utils import SamsUtils
+from .logos import DATA_LOGO_CACHE
+from .profiling import profiled
+from .utils import DATE, ID, MATCH_UUID, TEAM, SamsIndex, SamsUtils
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -48,12 +54,14 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][entry.data[CONF_REGION]]
 
     # Create entities list.
+    tracker = SamsTeamTracker(hass, coordinator, entry)
     entities = [
-        SamsTeamTracker(hass, coordinator, entry),
+        tracker,
+        tracker.score_sensor,
     ]
 
-    # Add sensor entities.
-    async_add_entities(entities, update_before_add=True)
+    # Add sensor entities - the coordinator is already refreshed for the region.
+    async_add_entities(entities)
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -63,6 +71,41 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 class SamsTeamTracker(CoordinatorEntity):
     """Representation of a sensor to provide team tracker compatible data."""
 
+    # static and fast changing attributes are not stored by the recorder,
+    # the live score is recorded by the lightweight score sensor instead
+    _unrecorded_attributes = frozenset(
+        {
+            "sport",
+            "league",
+            "league_logo",
+            "team_name",
+            "team_abbr",
+            "team_id",
+            "team_logo",
+            "team_colors",
+            "team_homeaway",
+            "team_num",
+            "opponent_name",
+            "opponent_abbr",
+            "opponent_id",
+            "opponent_logo",
+            "opponent_colors",
+            "opponent_homeaway",
+            "opponent_num",
+            "event_name",
+            "venue",
+            "location",
+            "quarter",
+            "team_score",
+            "opponent_score",
+            "match_sets_points",
+            "last_play",
+            "clock",
+            "kickoff_in",
+            "last_update",
+        }
+    )
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -88,6 +131,16 @@ class SamsTeamTracker(CoordinatorEntity):
         self._ticker_data = None
         self._match_data = None
         self._changed = False
+        # the selected match and the activity only change at known instants
+        self._selection_until: float | None = None
+        self._active_state: int | None = None
+        self._active_until: float | None = None
+        # availability of the last written state, the diff does not cover it
+        self._written_available: bool | None = None
+        # state and set progress of the last written state, points within a
+        # set are only written by the score sensor
+        self._written_progress: tuple | None = None
+        self.score_sensor = SamsScoreSensor(coordinator, entry)
 
     async def async_added_to_hass(self) -> None:
         """Subscribe timer events."""
@@ -114,11 +167,24 @@ class SamsTeamTracker(CoordinatorEntity):
         if self._coordinator.data:
             self._handle_coordinator_update()
 
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop tracking the match on removal."""
+        self._coordinator.untrack(self.unique_id)
+        await super().async_will_remove_from_hass()
+
+    def profile_context(self) -> tuple[str, str | None]:
+        return self._coordinator.name, self._match[ID] if self._match else None
+
+    @profiled("_update_overview")
     def _update_overview(self, data):
         _LOGGER.debug("Update team data for sensor %s", self._name)
         self._ticker_data = data
         self._changed = True
-        uuid_list = SamsUtils.get_uuids_by_name(data, self._name, self._league_name)
+        self._active_state = None
+        index = self._coordinator.index
+        if index is None or index.data is not data:
+            index = SamsIndex(data)
+        uuid_list = index.get_uuids_by_name(self._name, self._league_name)
         if len(uuid_list) == 0:
             _LOGGER.warning(
                 "No team data found for %s - %s", self._name, self._league_name
@@ -127,42 +193,136 @@ class SamsTeamTracker(CoordinatorEntity):
         matches = []
         idx = 0
         while len(matches) == 0 and idx < len(uuid_list):
-            matches = SamsUtils.get_matches(data, uuid_list[idx])
+            matches = index.get_matches(uuid_list[idx])
             idx += 1
         if len(matches) > 0:
             self._team_uuid = uuid_list[idx - 1]
-            self._team, _ = SamsUtils.get_team_by_id(data, self._team_uuid)
-            self._match = SamsUtils.select_match(data, matches)
+            self._team, _ = index.get_team_by_id(self._team_uuid)
+            now_ts = self._coordinator.now_ts()
+            self._selection_until = SamsUtils.next_selection_change(
+                data, matches, now_ts
+            )
+            self._match = SamsUtils.select_match(data, matches, now_ts)
             self._state = SamsUtils.state_from_match(data, self._match)
         else:
-            self._team, _ = SamsUtils.get_team_by_id(data, uuid_list[0])
+            self._team, _ = index.get_team_by_id(uuid_list[0])
             self._state = STATES_NOT_FOUND
             self._match = None
+        if self._match_data and (
+            not self._match or self._match_data.get(MATCH_UUID) != self._match[ID]
+        ):
+            # live data of a previously selected match
+            self._match_data = None
+        self._coordinator.track(
+            self.unique_id, self._team[ID] if self._team else None, self._match
+        )
+
+    def _skip_overview(self, data) -> bool:
+        """Check if a full update did not change the team, opponent or match.
+
+        Unchanged trackers only switch to the objects of the new overview,
+        without rebuilding their attributes and writing their state again.
+        """
+        changes = self._coordinator.changes
+        index = self._coordinator.index
+        if (
+            changes is None
+            or self._ticker_data is None
+            or self._team is None
+            or self._match is None
+            or index is None
+            or index.data is not data
+            or self.get_active_state() != NO_GAME
+        ):
+            return False
+        team_ids = (self._team[ID], self._match[TEAM + "1"], self._match[TEAM + "2"])
+        if self._match[ID] in changes.matches or not changes.teams.isdisjoint(team_ids):
+            return False
+        match = index.get_match(self._match[ID])
+        team, _ = index.get_team_by_id(self._team[ID])
+        if match is None or team is None:
+            return False
+        if (
+            self._selection_until is not None
+            and self._coordinator.now_ts() >= self._selection_until
+        ):
+            # the selection moves on in time, e.g. a day after the match
+            return False
+        self._ticker_data = data
+        self._match = match
+        self._team = team
+        return True
 
     def get_active_state(self):
+        """Return the activity, recomputed only on new data or at its deadline."""
+        now_ts = self._coordinator.now_ts()
+        if self._active_state is None or (
+            self._active_until is not None and now_ts >= self._active_until
+        ):
+            self._active_state, self._active_until = self._compute_active_state(now_ts)
+        return self._active_state
+
+    def _compute_active_state(self, now_ts: float) -> tuple[int, float | None]:
         # check if we are nearby (2 hours before / 3 hours behind)
         if self._state == STATES_IN:
-            return IN_GAME
-        if self._match and "date" in self._attr:
-            date = self._attr["date"]
-            duration = (dt_util.now() - date).total_seconds()
-            if (-2 * 60 * 60) < duration < (3 * 60 * 60):
-                return NEAR_GAME
-        return NO_GAME
+            return IN_GAME, None
+        if self._match:
+            kickoff_ts = float(self._match[DATE]) / 1000
+            if now_ts <= kickoff_ts - NEAR_GAME_BEFORE:
+                return NO_GAME, kickoff_ts - NEAR_GAME_BEFORE
+            if now_ts < kickoff_ts + NEAR_GAME_AFTER:
+                return NEAR_GAME, kickoff_ts + NEAR_GAME_AFTER
+        return NO_GAME, None
 
     @callback
+    @profiled("_handle_coordinator_update")
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
 
         data = self._coordinator.data
         if data is not None:
             if SamsUtils.is_overview(data):
+                if self.available == self._written_available and self._skip_overview(
+                    data
+                ):
+                    return
                 self._update_overview(data)
             elif SamsUtils.is_match(data):
                 if self._match and SamsUtils.is_my_match(data, self._match):
                     self._match_data = SamsUtils.get_match_data(data)
                     self._changed = True
+                    live_state = SamsUtils.state_from_match_state(self._match_data)
+                    if live_state != self._state:
+                        # with a healthy socket the overview is fetched rarely
+                        self._state = live_state
+                        self._active_state = None
+                    if self._progress() == self._written_progress:
+                        # a point within the set - only the score sensor writes
+                        self.score_sensor.update_score(
+                            live_state, self.extra_state_attributes
+                        )
+                        return
         super()._handle_coordinator_update()
+        self._written_available = self.available
+        self._written_progress = self._progress()
+        state = (
+            SamsUtils.state_from_match_state(self._match_data)
+            if self._match_data
+            else self._state
+        )
+        self.score_sensor.update_score(state, self._attr)
+
+    def _progress(self) -> tuple:
+        """Return the state, availability and set points of the tracked match."""
+        match_data: dict[str, Any] = self._match_data or {}
+        set_points = match_data.get("setPoints") or {}
+        return (
+            self._state,
+            self.available,
+            set_points.get("team1"),
+            set_points.get("team2"),
+            len(match_data.get("matchSets") or ()),
+        )
 
     @property
     def unique_id(self) -> str:
@@ -179,11 +339,13 @@ class SamsTeamTracker(CoordinatorEntity):
         return self._state
 
     @property
+    @profiled("extra_state_attributes")
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state message."""
         if not self._changed:
             return self._attr
 
+        previous = dict(self._attr)
         self._attr[ATTR_ATTRIBUTION] = ATTRIBUTION
         self._attr["sport"] = VOLLEYBALL
         self._attr["league_logo"] = LEAGUE_URL_LOGO_MAP[self._config.data[CONF_REGION]]
@@ -206,9 +368,28 @@ class SamsTeamTracker(CoordinatorEntity):
                 )
         except Exception as e:
             _LOGGER.warning("Fill attributes - exception %s", e)
+        self._proxy_logos()
+        self._keep_last_update(previous)
         self._changed = False
         return self._attr
 
+    def _proxy_logos(self) -> None:
+        """Point the logos to the local logo cache."""
+        cache = self.hass.data.get(DATA_LOGO_CACHE)
+        if cache is None:
+            return
+        for attr in ("team_logo", "opponent_logo", "league_logo"):
+            if attr in self._attr:
+                self._attr[attr] = cache.proxy_url(self._attr[attr])
+
+    def _keep_last_update(self, previous: dict[str, Any]) -> None:
+        """Keep last_update if nothing else changed to avoid a state write."""
+        if "last_update" not in previous:
+            return
+        current = {k: v for k, v in self._attr.items() if k != "last_update"}
+        if current == {k: v for k, v in previous.items() if k != "last_update"}:
+            self._attr["last_update"] = previous["last_update"]
+
     @property
     def available(self) -> bool:
         """Return if entity is available."""
@@ -218,3 +399,59 @@ class SamsTeamTracker(CoordinatorEntity):
     def icon(self) -> str:
         """Return the icon to use in the frontend, if any."""
         return DEFAULT_ICON
+
+
+class SamsScoreSensor(SensorEntity):
+    """Lightweight sensor with the live score of the tracked match.
+
+    The state is the score of the running set, after the match the set points.
+    It is fed by the team tracker and recorded instead of its attributes.
+    """
+
+    _attr_should_poll = False
+    _attr_icon = DEFAULT_ICON
+
+    def __init__(self, coordinator: SamsDataCoordinator, entry: ConfigEntry) -> None:
+        """Initialize the score sensor."""
+        self._coordinator = coordinator
+        self._attr_name = f"{entry.data[CONF_TEAM_NAME]} Score"
+        self._attr_unique_id = (
+            f"{slugify(entry.data[CONF_TEAM_NAME])}_{entry.entry_id}_score"
+        )
+        self._attr_extra_state_attributes: dict[str, Any] = {}
+        self._attr_native_value: str | None = None
+        # the coordinator is tracked by the team tracker - remember the written
+        # availability to follow its failures and recoveries
+        self._written_available: bool | None = None
+
+    @callback
+    def update_score(self, state: str, attrs: dict[str, Any]) -> None:
+        """Take over the score from the attributes of the team tracker."""
+        value = None
+        if state == STATES_IN:
+            value = f"{attrs.get('team_score')}:{attrs.get('opponent_score')}"
+        elif state == STATES_POST:
+            value = f"{attrs.get('team_sets_won')}:{attrs.get('opponent_sets_won')}"
+        sets_points = attrs.get("match_sets_points")
+        extra = {
+            "match_id": attrs.get("match_id"),
+            "set_number": sets_points[-1][1] if sets_points else None,
+            "team_sets_won": attrs.get("team_sets_won"),
+            "opponent_sets_won": attrs.get("opponent_sets_won"),
+        }
+        if (
+            value == self._attr_native_value
+            and extra == self.extra_state_attributes
+            and self.available == self._written_available
+        ):
+            return
+        self._attr_native_value = value
+        self._attr_extra_state_attributes = extra
+        if self.hass is not None:
+            self.async_write_ha_state()
+            self._written_available = self.available
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return self._coordinator.last_update_success
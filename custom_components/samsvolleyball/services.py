@@ -0,0 +1,169 @@
+"""Services of the sams-volleyball integration."""
+
+from __future__ import annotations
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ATTR_BUDGET_MS,
+    ATTR_DURATION,
+    ATTR_ENABLED,
+    ATTR_END,
+    ATTR_LIMIT,
+    ATTR_MATCH_ID,
+    ATTR_START,
+    ATTR_TEAM_ID,
+    ATTR_TRACEMALLOC_TOP,
+    DOMAIN,
+    SERVICE_CAPTURE_PROFILE,
+    SERVICE_GET_MATCH_HISTORY,
+    SERVICE_GET_MATCH_TIMELINE,
+    SERVICE_MEMORY_REPORT,
+    SERVICE_SET_PROFILING,
+)
+from .archive import DATA_ARCHIVE
+from .memory import coordinator_report, tracemalloc_report
+from .profiling import PROFILER
+
+GET_MATCH_TIMELINE_SCHEMA = vol.Schema({vol.Required(ATTR_MATCH_ID): cv.string})
+SET_PROFILING_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ENABLED): cv.boolean,
+        vol.Optional(ATTR_BUDGET_MS): vol.All(vol.Coerce(float), vol.Range(min=0)),
+    }
+)
+CAPTURE_PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DURATION, default=60): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=3600)
+        ),
+    }
+)
+
+MEMORY_REPORT_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_TRACEMALLOC_TOP): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=100)
+        ),
+    }
+)
+
+GET_MATCH_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_TEAM_ID): cv.string,
+        vol.Optional(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+        vol.Optional(ATTR_LIMIT, default=100): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=1000)
+        ),
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services once."""
+    if hass.services.has_service(DOMAIN, SERVICE_GET_MATCH_TIMELINE):
+        return
+
+    async def get_match_timeline(call: ServiceCall) -> ServiceResponse:
+        match_id = call.data[ATTR_MATCH_ID]
+        for coordinator in hass.data.get(DOMAIN, {}).values():
+            if match_id in coordinator.timelines:
+                return coordinator.timelines[match_id].as_dict()
+        raise HomeAssistantError(f"No timeline recorded for match {match_id}")
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_MATCH_TIMELINE,
+        get_match_timeline,
+        schema=GET_MATCH_TIMELINE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    async def set_profiling(call: ServiceCall) -> None:
+        budget_ms = call.data.get(ATTR_BUDGET_MS)
+        PROFILER.configure(
+            call.data[ATTR_ENABLED], budget_ms / 1000 if budget_ms is not None else None
+        )
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_SET_PROFILING, set_profiling, schema=SET_PROFILING_SCHEMA
+    )
+
+    async def capture_profile(call: ServiceCall) -> ServiceResponse:
+        profile = await PROFILER.async_capture(call.data[ATTR_DURATION])
+        path = hass.config.path(
+            f"{DOMAIN}_profile_{dt_util.utcnow().strftime('%Y%m%d_%H%M%S')}.cprof"
+        )
+        await hass.async_add_executor_job(profile.dump_stats, path)
+        return {"path": path}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_CAPTURE_PROFILE,
+        capture_profile,
+        schema=CAPTURE_PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def memory_report(call: ServiceCall) -> ServiceResponse:
+        response: dict = {
+            "regions": {
+                coordinator.name: coordinator_report(coordinator)
+                for coordinator in hass.data.get(DOMAIN, {}).values()
+            }
+        }
+        if ATTR_TRACEMALLOC_TOP in call.data:
+            response["tracemalloc"] = tracemalloc_report(
+                call.data[ATTR_TRACEMALLOC_TOP]
+            )
+        return response
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_MEMORY_REPORT,
+        memory_report,
+        schema=MEMORY_REPORT_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    async def get_match_history(call: ServiceCall) -> ServiceResponse:
+        archive = hass.data.get(DATA_ARCHIVE)
+        if archive is None:
+            raise HomeAssistantError("Match archive not available")
+        start = call.data.get(ATTR_START)
+        end = call.data.get(ATTR_END)
+        start_ts = int(dt_util.as_timestamp(start)) if start else None
+        end_ts = int(dt_util.as_timestamp(end)) if end else None
+        team_id = call.data.get(ATTR_TEAM_ID)
+        response: dict = {
+            "matches": await archive.async_query(
+                team_id, start_ts, end_ts, call.data[ATTR_LIMIT]
+            )
+        }
+        if team_id:
+            # over all matches in the range, not only the returned ones
+            response["statistics"] = await archive.async_statistics(
+                team_id, start_ts, end_ts
+            )
+        return response
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_MATCH_HISTORY,
+        get_match_history,
+        schema=GET_MATCH_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
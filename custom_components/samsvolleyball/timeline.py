@@ -0,0 +1,98 @@
+"""Bounded point-by-point history of tracked matches."""
+
+from __future__ import annotations
+
+from array import array
+
+from .const import TIMELINE_MAX_SETS, TIMELINE_RALLIES_PER_SET
+
+MATCHSETS = "matchSets"
+SETNUMBER = "setNumber"
+SETSCORE = "setScore"
+FINISHED = "finished"
+
+
+class RallyRing:
+    """Fixed size ring buffer of score pairs with their timestamps for one set."""
+
+    __slots__ = ("_len", "_start", "_team1", "_team2", "_ts")
+
+    def __init__(self, capacity: int = TIMELINE_RALLIES_PER_SET) -> None:
+        """Preallocate the arrays - memory does not grow after init."""
+        self._team1 = array("H", [0]) * capacity
+        self._team2 = array("H", [0]) * capacity
+        self._ts = array("L", [0]) * capacity
+        self._start = 0
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def _last(self) -> int:
+        return (self._start + self._len - 1) % len(self._ts)
+
+    def append(self, ts: int, score1: int, score2: int) -> bool:
+        """Append a score pair, returns False if the score did not change."""
+        if self._len:
+            last = self._last()
+            if self._team1[last] == score1 and self._team2[last] == score2:
+                return False
+        capacity = len(self._ts)
+        if self._len == capacity:
+            # overwrite the oldest entry
+            idx = self._start
+            self._start = (self._start + 1) % capacity
+        else:
+            idx = (self._start + self._len) % capacity
+            self._len += 1
+        self._team1[idx] = score1
+        self._team2[idx] = score2
+        self._ts[idx] = ts
+        return True
+
+    def as_list(self) -> list[list[int]]:
+        capacity = len(self._ts)
+        result = []
+        for i in range(self._len):
+            idx = (self._start + i) % capacity
+            result.append([self._ts[idx], self._team1[idx], self._team2[idx]])
+        return result
+
+
+class MatchTimeline:
+    """Rally timeline of a single match, one ring buffer per set."""
+
+    __slots__ = ("finished_ts", "match_id", "sets")
+
+    def __init__(self, match_id: str) -> None:
+        """Init an empty timeline."""
+        self.match_id = match_id
+        self.sets: list[RallyRing | None] = [None] * TIMELINE_MAX_SETS
+        self.finished_ts: float | None = None
+
+    def add_state(self, ts: float, match_state: dict) -> bool:
+        """Add the scores of a MATCH_UPDATE payload, returns True if anything changed."""
+        changed = False
+        for match_set in match_state.get(MATCHSETS, []):
+            idx = int(match_set[SETNUMBER]) - 1
+            if not 0 <= idx < TIMELINE_MAX_SETS:
+                continue
+            ring = self.sets[idx]
+            if ring is None:
+                ring = self.sets[idx] = RallyRing()
+            score = match_set[SETSCORE]
+            changed |= ring.append(int(ts), int(score["team1"]), int(score["team2"]))
+        if match_state.get(FINISHED) and self.finished_ts is None:
+            self.finished_ts = ts
+        return changed
+
+    def as_dict(self) -> dict:
+        return {
+            "match_id": self.match_id,
+            "finished": self.finished_ts is not None,
+            "sets": [
+                {"set_number": idx + 1, "rallies": ring.as_list()}
+                for idx, ring in enumerate(self.sets)
+                if ring is not None
+            ],
+        }
@@ -3,9 +3,15 @@
 from __future__ import annotations
 
 from datetime import datetime
+import json
 import logging
+import re
 import sys
+from types import MappingProxyType
+from typing import NamedTuple
+import zlib
 
+from aiohttp import ClientPayloadError
 import arrow
 
 from homeassistant.util import dt as dt_util
@@ -35,6 +41,9 @@ STARTED = "started"
 
 SECONDS_PER_DAY = 24 * 60 * 60
 
+_PEEK_TYPE = re.compile(r'"type"\s*:\s*"([^"]*)"')
+_PEEK_MATCH_UUID = re.compile(r'"matchUuid"\s*:\s*"([^"]*)"')
+
 
 class SamsUtils:
     @staticmethod
@@ -43,7 +52,7 @@ class SamsUtils:
 
     @staticmethod
     def is_match(data: dict) -> bool:
-        return data[TYPE] == TYPE_MATCH
+        return data.get(TYPE) == TYPE_MATCH
 
     @staticmethod
     def is_my_match(data: dict, match: dict) -> bool:
@@ -51,6 +60,57 @@ class SamsUtils:
             return data[PAYLOAD][MATCH_UUID] == match[ID]
         return False
 
+    @staticmethod
+    def decompress(body: bytes, encoding: str | None) -> bytes:
+        """Decode a body read with the content encodings of GET_HEADERS."""
+        try:
+            if encoding == "gzip":
+                return zlib.decompress(body, 16 + zlib.MAX_WBITS)
+            if encoding == "deflate":
+                # zlib wrapped as specified, but some servers send raw deflate
+                decompressor = zlib.decompressobj(
+                    zlib.MAX_WBITS if body[:1] == b"\x78" else -zlib.MAX_WBITS
+                )
+                return decompressor.decompress(body) + decompressor.flush()
+        except zlib.error as exc:
+            raise ClientPayloadError(f"Cannot decode {encoding} body: {exc}") from exc
+        return body
+
+    @staticmethod
+    def peek_match_uuid(text: str) -> str | None:
+        """Extract the match uuid of a raw MATCH_UPDATE frame without decoding it.
+
+        Returns None if the frame is no match update or cannot be peeked, the
+        caller has to decode it completely then. The keys are only trusted if
+        they occur once, a second occurrence may be nested anywhere.
+        """
+        types = _PEEK_TYPE.findall(text)
+        if len(types) != 1 or types[0] != TYPE_MATCH:
+            return None
+        uuids = _PEEK_MATCH_UUID.findall(text)
+        return uuids[0] if len(uuids) == 1 else None
+
+    @staticmethod
+    def get_match_uuid(data: dict) -> str:
+        return data[PAYLOAD][MATCH_UUID]
+
+    @staticmethod
+    def match_fingerprint(match_state: dict) -> tuple:
+        """Return the parts of a match state the sensors evaluate as hashable tuple."""
+        return (
+            match_state.get(STARTED),
+            match_state.get(FINISHED),
+            tuple(sorted((match_state.get("setPoints") or {}).items())),
+            tuple(
+                (
+                    match_set["setNumber"],
+                    match_set["setScore"]["team1"],
+                    match_set["setScore"]["team2"],
+                )
+                for match_set in match_state.get("matchSets") or []
+            ),
+        )
+
     @staticmethod
     def get_leaguelist(data: dict, gender=None) -> list[dict[str, str]]:
         leagues: list[dict[str, str]] = []
@@ -158,8 +218,10 @@ class SamsUtils:
         return dt_util.as_local(dt_util.utc_from_timestamp(float(match[DATE]) / 1000))
 
     @staticmethod
-    def select_match(data: dict, matches: list):
+    def select_match(data: dict, matches: list, now_ts: float | None = None):
         # assumes matches are sorted by date
+        if now_ts is None:
+            now_ts = dt_util.utcnow().timestamp()
         for match in matches:
             state = SamsUtils.state_from_match(data, match)
             # prefer active matches
@@ -169,9 +231,7 @@ class SamsUtils:
         for match in matches:
             state = SamsUtils.state_from_match(data, match)
             if state == STATES_POST:
-                duration = (
-                    dt_util.now() - SamsUtils.date_from_match(match)
-                ).total_seconds()
+                duration = now_ts - SamsUtils.date_from_match(match).timestamp()
                 if duration < SECONDS_PER_DAY:
                     return match
 
@@ -182,9 +242,7 @@ class SamsUtils:
             state = SamsUtils.state_from_match(data, match)
             if state == STATES_PRE:
                 # select the next
-                time_to_start = (
-                    SamsUtils.date_from_match(match) - dt_util.now()
-                ).total_seconds()
+                time_to_start = SamsUtils.date_from_match(match).timestamp() - now_ts
                 if time_to_start < min_timediff:
                     min_timediff = time_to_start
                     next_match = match
@@ -195,6 +253,24 @@ class SamsUtils:
         # fallback return latest
         return matches.pop(-1)
 
+    @staticmethod
+    def next_selection_change(
+        data: dict, matches: list, now_ts: float | None = None
+    ) -> float | None:
+        """Return when select_match may choose another match without new data.
+
+        Only a finished match drops out of the selection, one day after its
+        kickoff - None if there is no such match.
+        """
+        if now_ts is None:
+            now_ts = dt_util.utcnow().timestamp()
+        deadlines = [
+            float(match[DATE]) / 1000 + SECONDS_PER_DAY
+            for match in matches
+            if SamsUtils.state_from_match(data, match) == STATES_POST
+        ]
+        return min((ts for ts in deadlines if ts > now_ts), default=None)
+
     @staticmethod
     def _get_set_string(match_state, team_num, opponent_num, offset):
         set_string = ""
@@ -375,3 +451,118 @@ class SamsUtils:
         attrs["last_update"] = dt_util.as_local(dt_util.now())
 
         return attrs
+
+
+class OverviewChanges(NamedTuple):
+    """Ids of the teams and matches changed between two overviews."""
+
+    teams: frozenset[str]
+    matches: frozenset[str]
+
+
+class SamsIndex:
+    """Immutable lookup tables of a full ticker json.
+
+    Built once per GET - if the payload is large it is built in an executor
+    together with the json decode - so the sensors do not have to scan the
+    whole region on every update.
+    """
+
+    __slots__ = ("_matches", "_matches_by_team", "_teams", "_uuids_by_name", "data")
+
+    def __init__(self, data: dict) -> None:
+        """Build the lookup tables."""
+        teams: dict[str, tuple[dict, dict]] = {}
+        uuids_by_name: dict[tuple[str, str], list[str]] = {}
+        matches_by_team: dict[str, list[dict]] = {}
+        matches: dict[str, dict] = {}
+        if SamsUtils.is_overview(data):
+            for series in data[MATCHSERIES].values():
+                for team in series[TEAMS]:
+                    teams.setdefault(team[ID], (team, series))
+                    uuids_by_name.setdefault((series[NAME], team[NAME]), []).append(
+                        team[ID]
+                    )
+            for matchday in data[MATCHDAYS]:
+                for match in matchday[MATCHES]:
+                    matches[match[ID]] = match
+                    matches_by_team.setdefault(match[TEAM + "1"], []).append(match)
+                    matches_by_team.setdefault(match[TEAM + "2"], []).append(match)
+        self.data = data
+        self._matches = MappingProxyType(matches)
+        self._teams = MappingProxyType(teams)
+        self._uuids_by_name = MappingProxyType(
+            {key: tuple(value) for key, value in uuids_by_name.items()}
+        )
+        self._matches_by_team = MappingProxyType(
+            {key: tuple(value) for key, value in matches_by_team.items()}
+        )
+
+    @staticmethod
+    def from_json(body: bytes | str) -> SamsIndex:
+        """Decode the json and build the index - safe to run in an executor."""
+        return SamsIndex(json.loads(body))
+
+    @staticmethod
+    def ingest(
+        body: bytes | str, previous: SamsIndex | None
+    ) -> tuple[SamsIndex, OverviewChanges | None]:
+        """Build the index and diff it against the previous one."""
+        index = SamsIndex.from_json(body)
+        return index, index.diff(previous)
+
+    def diff(self, previous: SamsIndex | None) -> OverviewChanges | None:
+        """Return the teams and matches changed since the previous overview.
+
+        A changed series (e.g. its rankings) changes all of its teams, a
+        changed match or match state also changes both of its teams.
+        None if there is nothing to compare with.
+        """
+        if (
+            previous is None
+            or not SamsUtils.is_overview(previous.data)
+            or not SamsUtils.is_overview(self.data)
+        ):
+            return None
+        teams: set[str] = set()
+        matches: set[str] = set()
+        series_old = previous.data[MATCHSERIES]
+        series_new = self.data[MATCHSERIES]
+        for series_id in series_old.keys() | series_new.keys():
+            old, new = series_old.get(series_id), series_new.get(series_id)
+            if old != new:
+                for series in (old, new):
+                    if series:
+                        teams.update(team[ID] for team in series[TEAMS])
+        states_old = previous.data.get(MATCHSTATES) or {}
+        states_new = self.data.get(MATCHSTATES) or {}
+        for match_id in previous._matches.keys() | self._matches.keys():
+            old, new = previous._matches.get(match_id), self._matches.get(match_id)
+            if old != new or states_old.get(match_id) != states_new.get(match_id):
+                matches.add(match_id)
+                for match in (old, new):
+                    if match:
+                        teams.update((match[TEAM + "1"], match[TEAM + "2"]))
+        return OverviewChanges(frozenset(teams), frozenset(matches))
+
+    def get_uuids_by_name(self, name: str, league: str) -> list[str]:
+        return list(self._uuids_by_name.get((league, name), ()))
+
+    def get_team_by_id(self, team_id: str):
+        return self._teams.get(team_id, (None, None))
+
+    def get_matches(self, team_id: str) -> list[dict]:
+        return list(self._matches_by_team.get(team_id, ()))
+
+    def get_match(self, match_id: str) -> dict | None:
+        return self._matches.get(match_id)
+
+    def get_next_kickoff(self, team_ids: set[str], now_ts: float):
+        """Return the timestamp of the next match of one of the teams or None."""
+        next_ts = None
+        for team_id in team_ids:
+            for match in self._matches_by_team.get(team_id, ()):
+                kickoff_ts = float(match[DATE]) / 1000
+                if kickoff_ts > now_ts and (next_ts is None or kickoff_ts < next_ts):
+                    next_ts = kickoff_ts
+        return next_ts
@@ -0,0 +1,183 @@
+"""Helpers of the samsvolleyball tests."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+import contextlib
+from datetime import timedelta
+import json
+import logging
+
+from aiohttp import ClientError
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import (
+    area_registry as ar,
+    device_registry as dr,
+    entity,
+    entity_registry as er,
+)
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import EntityPlatform
+
+from custom_components.samsvolleyball import SamsDataCoordinator
+from custom_components.samsvolleyball.const import (
+    CONF_GENDER,
+    CONF_GET_URL,
+    CONF_HOST,
+    CONF_LEAGUE,
+    CONF_LEAGUE_NAME,
+    CONF_REGION,
+    CONF_TEAM_NAME,
+    CONF_TEAM_UUID,
+    CONFIG_ENTRY_VERSION,
+    DOMAIN,
+)
+
+
+@contextlib.asynccontextmanager
+async def async_test_home_assistant(config_dir: str) -> AsyncIterator[HomeAssistant]:
+    """Yield a bare Home Assistant instance with its registries, stopped on exit."""
+    hass = HomeAssistant(config_dir)
+    entity.async_setup(hass)
+    await ar.async_load(hass)
+    await dr.async_load(hass)
+    await er.async_load(hass)
+    try:
+        yield hass
+    finally:
+        await hass.async_stop(force=True)
+
+
+def team(team_id: str, name: str) -> dict:
+    """Return a team of the ticker overview."""
+    return {
+        "id": team_id,
+        "name": name,
+        "shortName": name[:3],
+        "letter": "",
+        "logoImage200": f"https://logos.invalid/{team_id}.png",
+    }
+
+
+def series(series_id: str, name: str, teams: list[dict]) -> dict:
+    """Return a league with its teams and rankings."""
+    return {
+        "id": series_id,
+        "name": name,
+        "class": "League",
+        "gender": "FEMALE",
+        "teams": teams,
+        "rankings": {
+            "fullRankings": [
+                {
+                    "team": {"id": team["id"]},
+                    "rankingPosition": position,
+                    "scoreDetails": {"matchesPlayed": 0, "winScore": 0},
+                }
+                for position, team in enumerate(teams, 1)
+            ]
+        },
+    }
+
+
+def match(match_id: str, team1: str, team2: str, kickoff_ts: float) -> dict:
+    """Return a match of the ticker overview."""
+    return {
+        "id": match_id,
+        "team1": team1,
+        "team2": team2,
+        "date": str(int(kickoff_ts * 1000)),
+    }
+
+
+def match_state(
+    sets: list[tuple[int, int]], set_points: tuple[int, int] = (0, 0), **flags
+) -> dict:
+    """Return the state of a match with the scores of its sets."""
+    return {
+        "started": flags.get("started", bool(sets)),
+        "finished": flags.get("finished", False),
+        "setPoints": {"team1": set_points[0], "team2": set_points[1]},
+        "matchSets": [
+            {"setNumber": number, "setScore": {"team1": score1, "team2": score2}}
+            for number, (score1, score2) in enumerate(sets, 1)
+        ],
+    }
+
+
+def overview(
+    leagues: list[dict], matches: list[dict], states: dict[str, dict] | None = None
+) -> dict:
+    """Return a ticker overview of a region."""
+    return {
+        "matchSeries": {league["id"]: league for league in leagues},
+        "matchDays": [{"matches": matches}],
+        "matchStates": states or {},
+    }
+
+
+def match_update(match_id: str, state: dict) -> dict:
+    """Return a websocket frame with the new state of a match."""
+    return {"type": "MATCH_UPDATE", "payload": {"matchUuid": match_id, **state}}
+
+
+class StubBackend:
+    """Stand-in for the ticker backend serving the full GET of a coordinator."""
+
+    def __init__(self, data: dict) -> None:
+        """Init the backend with the overview to serve."""
+        self.data = data
+        self.fail = False
+        self.requests = 0
+
+    async def async_get_body(self) -> bytes:
+        self.requests += 1
+        if self.fail:
+            raise ClientError("backend down")
+        return json.dumps(self.data).encode()
+
+    def attach(self, coordinator: SamsDataCoordinator) -> SamsDataCoordinator:
+        coordinator._get_full_body = self.async_get_body
+        return coordinator
+
+
+def config_entry(team_name: str, league_name: str, entry_id: str) -> ConfigEntry:
+    """Return a config entry tracking a team of the baden region."""
+    return ConfigEntry(
+        version=CONFIG_ENTRY_VERSION,
+        minor_version=1,
+        domain=DOMAIN,
+        title=f"{team_name} ({league_name})",
+        data={
+            CONF_HOST: "ws://backend.invalid/indoor/",
+            CONF_GET_URL: "http://backend.invalid/live/indoor/tickers/",
+            CONF_REGION: "baden",
+            CONF_GENDER: "FEMALE",
+            CONF_LEAGUE: "league",
+            CONF_LEAGUE_NAME: league_name,
+            CONF_TEAM_NAME: team_name,
+            CONF_TEAM_UUID: "unknown",
+        },
+        source="user",
+        options={},
+        entry_id=entry_id,
+    )
+
+
+async def async_add_to_platform(
+    hass: HomeAssistant, domain: str, entities: list[Entity]
+) -> EntityPlatform:
+    """Add entities through an entity platform of the integration."""
+    platform = EntityPlatform(
+        hass=hass,
+        logger=logging.getLogger(__name__),
+        domain=domain,
+        platform_name=DOMAIN,
+        platform=None,
+        scan_interval=timedelta(seconds=30),
+        entity_namespace=None,
+    )
+    await platform.async_add_entities(entities)
+    return platform
@@ -0,0 +1,154 @@
+"""Tests for the samsvolleyball match archive."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from custom_components.samsvolleyball import SamsDataCoordinator
+from custom_components.samsvolleyball.archive import (
+    MatchArchive,
+    async_setup_archive,
+    build_row,
+)
+from custom_components.samsvolleyball.const import DOMAIN, SERVICE_GET_MATCH_HISTORY
+from custom_components.samsvolleyball.services import async_setup_services
+
+from .common import (
+    StubBackend,
+    async_test_home_assistant,
+    match,
+    match_state,
+    overview,
+    series,
+    team,
+)
+
+# (opponent, own sets, other sets) of team a, oldest first
+RESULTS = [("b", 3, 0), ("c", 1, 3), ("b", 3, 2), ("c", 0, 3), ("b", 3, 1)]
+
+
+def _rows() -> list[tuple]:
+    rows = []
+    for number, (opponent, own, other) in enumerate(RESULTS):
+        state = match_state([], (own, other), finished=True)
+        # team a plays at home on even matches
+        if number % 2:
+            state = match_state([], (other, own), finished=True)
+            pairing = (opponent, "a")
+        else:
+            pairing = ("a", opponent)
+        rows.append(
+            build_row(
+                "baden",
+                match(f"m{number}", *pairing, 1000 * (number + 1)),
+                state,
+                {"name": f"Team {pairing[0]}"},
+                {"name": f"Team {pairing[1]}"},
+                "Oberliga",
+            )
+        )
+    return rows
+
+
+async def test_statistics_cover_all_matches(tmp_path) -> None:
+    """The limit applies to the listed matches, not to the statistics."""
+    async with async_test_home_assistant(str(tmp_path)) as hass:
+        archive = await async_setup_archive(hass)
+        await archive.async_add(_rows())
+        async_setup_services(hass)
+
+        response = await hass.services.async_call(
+            DOMAIN,
+            SERVICE_GET_MATCH_HISTORY,
+            {"team_id": "a", "limit": 2},
+            blocking=True,
+            return_response=True,
+        )
+        assert [row["match_id"] for row in response["matches"]] == ["m4", "m3"]
+        assert response["statistics"] == {
+            "played": 5,
+            "won": 3,
+            "lost": 2,
+            "sets_won": 10,
+            "sets_lost": 9,
+        }
+
+        assert await archive.async_statistics("b") == {
+            "played": 3,
+            "won": 0,
+            "lost": 3,
+            "sets_won": 3,
+            "sets_lost": 9,
+        }
+        # the range applies to both
+        assert await archive.async_statistics("a", start=2000, end=4000) == {
+            "played": 2,
+            "won": 1,
+            "lost": 1,
+            "sets_won": 4,
+            "sets_lost": 5,
+        }
+        assert await archive.async_statistics("unknown") == {
+            "played": 0,
+            "won": 0,
+            "lost": 0,
+            "sets_won": 0,
+            "sets_lost": 0,
+        }
+        await archive.async_close()
+
+
+async def test_closed_archive(tmp_path) -> None:
+    """A closed archive answers empty, direct access raises."""
+    async with async_test_home_assistant(str(tmp_path)) as hass:
+        archive = MatchArchive(hass, str(tmp_path / "archive.db"))
+        assert await archive.async_query("a") == []
+        assert await archive.async_statistics("a") == {}
+        with pytest.raises(RuntimeError):
+            archive._query("a", None, None, 10)
+
+
+async def test_finished_matches_without_league_are_not_archived(tmp_path) -> None:
+    """A finished match is archived only once its league is known."""
+    async with async_test_home_assistant(str(tmp_path)) as hass:
+        archive = await async_setup_archive(hass)
+        finished = match_state([(25, 20), (25, 20), (25, 20)], (3, 0), finished=True)
+        league = series(
+            "league", "Oberliga", [team("a", "Team A"), team("b", "Team B")]
+        )
+        now = time.time()
+        backend = StubBackend(
+            overview(
+                [league],
+                [match("m1", "a", "b", now - 7200), match("m2", "x", "y", now - 7200)],
+                {"m1": finished, "m2": finished},
+            )
+        )
+        coordinator = backend.attach(
+            SamsDataCoordinator(
+                hass, None, "baden", "ws://x", "http://x", region="baden"
+            )
+        )
+
+        async def _async_archive() -> list[tuple[str, str]]:
+            await coordinator.async_refresh()
+            data = coordinator.data
+            coordinator._archive_finished(
+                (match, data["matchStates"][match["id"]])
+                for match in data["matchDays"][0]["matches"]
+            )
+            await hass.async_block_till_done()
+            return sorted(
+                (row["match_id"], row["league"]) for row in await archive.async_query()
+            )
+
+        assert await _async_archive() == [("m1", "Oberliga")]
+        assert "m2" not in coordinator._archived
+
+        backend.data["matchSeries"]["other"] = series(
+            "other", "Landesliga", [team("x", "Team X"), team("y", "Team Y")]
+        )
+        assert await _async_archive() == [("m1", "Oberliga"), ("m2", "Landesliga")]
+        await archive.async_close()
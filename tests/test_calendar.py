@@ -0,0 +1,89 @@
+"""Tests for the samsvolleyball calendar."""
+
+from __future__ import annotations
+
+import time
+
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.util import dt as dt_util
+
+from custom_components.samsvolleyball import SamsDataCoordinator
+from custom_components.samsvolleyball.calendar import SamsCalendar
+
+from .common import (
+    StubBackend,
+    async_add_to_platform,
+    async_test_home_assistant,
+    config_entry,
+    match,
+    overview,
+    series,
+    team,
+)
+
+
+def _region(now: float) -> dict:
+    league = series(
+        "league",
+        "Oberliga",
+        [team("a", "Team A"), team("b", "Team B"), team("c", "Team C")],
+    )
+    return overview(
+        [league],
+        [
+            match("m1", "a", "b", now - 7 * 86400),
+            match("m2", "c", "a", now + 7 * 86400),
+            match("m3", "b", "c", now + 8 * 86400),
+        ],
+    )
+
+
+async def test_fixtures_follow_the_change_set(tmp_path) -> None:
+    """Only the matches of the team are listed, changed matches are moved."""
+    async with async_test_home_assistant(str(tmp_path)) as hass:
+        now = time.time()
+        backend = StubBackend(_region(now))
+        coordinator = backend.attach(
+            SamsDataCoordinator(hass, None, "baden", "ws://x", "http://x")
+        )
+        await coordinator.async_refresh()
+        calendar = SamsCalendar(coordinator, config_entry("Team A", "Oberliga", "e1"))
+        await async_add_to_platform(hass, "calendar", [calendar])
+
+        start = dt_util.utc_from_timestamp(now - 30 * 86400)
+        end = dt_util.utc_from_timestamp(now + 30 * 86400)
+        events = await calendar.async_get_events(hass, start, end)
+        assert [event.uid for event in events] == ["m1", "m2"]
+        assert calendar.event.uid == "m2"
+
+        backend.data["matchDays"][0]["matches"][1]["date"] = str(
+            int((now + 86400) * 1000)
+        )
+        backend.data["matchDays"][0]["matches"].append(
+            match("m4", "a", "c", now + 3 * 86400)
+        )
+        await coordinator.async_refresh()
+        assert coordinator.changes.matches == {"m2", "m4"}
+        events = await calendar.async_get_events(hass, start, end)
+        assert [event.uid for event in events] == ["m1", "m2", "m4"]
+
+
+async def test_availability_is_written_after_unchanged_update(tmp_path) -> None:
+    """Failure and recovery are written although the fixtures did not change."""
+    async with async_test_home_assistant(str(tmp_path)) as hass:
+        backend = StubBackend(_region(time.time()))
+        coordinator = backend.attach(
+            SamsDataCoordinator(hass, None, "baden", "ws://x", "http://x")
+        )
+        await coordinator.async_refresh()
+        calendar = SamsCalendar(coordinator, config_entry("Team A", "Oberliga", "e1"))
+        await async_add_to_platform(hass, "calendar", [calendar])
+        assert hass.states.get(calendar.entity_id).state == "off"
+
+        backend.fail = True
+        await coordinator.async_refresh()
+        assert hass.states.get(calendar.entity_id).state == STATE_UNAVAILABLE
+
+        backend.fail = False
+        await coordinator.async_refresh()
+        assert hass.states.get(calendar.entity_id).state == "off"
@@ -0,0 +1,120 @@
+"""Tests for the samsvolleyball config flow."""
+
+from __future__ import annotations
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from homeassistant.data_entry_flow import FlowResultType
+
+from custom_components.samsvolleyball.config_flow import ConfigFlow
+from custom_components.samsvolleyball.const import (
+    CONF_GENDER,
+    CONF_GET_URL,
+    CONF_HOST,
+    CONF_LEAGUE,
+    CONF_LEAGUE_NAME,
+    CONF_REGION,
+    CONF_SEARCH,
+    CONF_TEAM_NAME,
+    CONF_TEAM_UUID,
+    DOMAIN,
+)
+
+from .common import async_test_home_assistant, overview, series, team
+
+REGIONS = {
+    "baden": overview(
+        [
+            series("l1", "Oberliga", [team("a", "TSV Alpha"), team("b", "SV Beta")]),
+            series("l2", "Landesliga", [team("a2", "TSV Alpha II")]),
+        ],
+        [],
+    ),
+    "bvv": overview([series("l3", "Bayernliga", [team("c", "Alpha Bären")])], []),
+}
+
+
+def _ticker_host(fail: bool = False) -> web.Application:
+    async def tickers(request: web.Request) -> web.Response:
+        region = request.match_info["region"]
+        if fail or region not in REGIONS:
+            raise web.HTTPServiceUnavailable
+        return web.json_response(REGIONS[region])
+
+    app = web.Application()
+    app.router.add_get("/tickers/{region}", tickers)
+    return app
+
+
+def _flow(hass, flow_id: str) -> ConfigFlow:
+    flow = ConfigFlow()
+    flow.hass = hass
+    flow.handler = DOMAIN
+    flow.flow_id = flow_id
+    flow.context = {"source": "user"}
+    return flow
+
+
+def _search(server: TestServer, query: str) -> dict[str, str]:
+    return {
+        CONF_HOST: "ws://localhost/indoor/",
+        CONF_GET_URL: str(server.make_url("/tickers/")),
+        CONF_REGION: "baden",
+        CONF_SEARCH: query,
+    }
+
+
+def _options(result) -> list[str]:
+    selector = result["data_schema"].schema[CONF_TEAM_NAME]
+    return [option["label"] for option in selector.config["options"]]
+
+
+async def test_search_selects_a_team(tmp_path) -> None:
+    """Teams of all regions are found, the selected one is configured."""
+    async with (
+        async_test_home_assistant(str(tmp_path)) as hass,
+        TestServer(_ticker_host()) as server,
+    ):
+        flow = _flow(hass, "f1")
+        result = await flow.async_step_user(_search(server, "alpha"))
+        assert result["type"] == FlowResultType.FORM
+        assert result["step_id"] == "search"
+        assert _options(result) == [
+            "Alpha Bären - Bayernliga (bvv)",
+            "TSV Alpha - Oberliga (baden)",
+            "TSV Alpha II - Landesliga (baden)",
+        ]
+
+        # another flow searching concurrently keeps its own results
+        other = _flow(hass, "f2")
+        result = await other.async_step_user(_search(server, "beta"))
+        assert _options(result) == ["SV Beta - Oberliga (baden)"]
+
+        result = await flow.async_step_search({CONF_TEAM_NAME: "baden/l1/a"})
+        assert result["type"] == FlowResultType.CREATE_ENTRY
+        assert result["title"] == "TSV Alpha (Oberliga)"
+        assert result["data"] == {
+            CONF_HOST: "ws://localhost/indoor/",
+            CONF_GET_URL: str(server.make_url("/tickers/")),
+            CONF_REGION: "baden",
+            CONF_GENDER: "FEMALE",
+            CONF_LEAGUE: "l1",
+            CONF_LEAGUE_NAME: "Oberliga",
+            CONF_TEAM_NAME: "TSV Alpha",
+            CONF_TEAM_UUID: "a",
+        }
+
+
+async def test_search_errors(tmp_path) -> None:
+    """No match and no answering region are reported in the form."""
+    async with async_test_home_assistant(str(tmp_path)) as hass:
+        async with TestServer(_ticker_host()) as server:
+            result = await _flow(hass, "f1").async_step_user(_search(server, "gamma"))
+            assert result["step_id"] == "user"
+            assert result["errors"] == {"base": "no_search_results"}
+
+        async with TestServer(_ticker_host(fail=True)) as server:
+            result = await _flow(hass, "f2").async_step_user(_search(server, "alpha"))
+            assert result["step_id"] == "user"
+            assert result["errors"] == {"base": "cannot_connect"}
@@ -0,0 +1,229 @@
+"""Tests for the samsvolleyball region coordinator."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import time
+
+from aiohttp import ClientSession, WSMessage, WSMsgType, hdrs, web
+from aiohttp.test_utils import TestServer
+
+from homeassistant.core import Event
+
+from custom_components.samsvolleyball import SamsDataCoordinator
+from custom_components.samsvolleyball.const import (
+    EVENT_MATCH_STARTED,
+    EVENT_POINT_SCORED,
+    IN_GAME,
+    STATES_IN,
+)
+from custom_components.samsvolleyball.sensor import SamsTeamTracker
+from custom_components.samsvolleyball.utils import SamsUtils
+
+from .common import (
+    StubBackend,
+    async_add_to_platform,
+    async_test_home_assistant,
+    config_entry,
+    match,
+    match_state,
+    match_update,
+    overview,
+    series,
+    team,
+)
+
+FRAMES = 2000
+
+
+def _region(now: float, state: dict) -> dict:
+    league = series("league", "Oberliga", [team("a", "Team A"), team("b", "Team B")])
+    return overview([league], [match("m1", "a", "b", now + 600)], {"m1": state})
+
+
+async def _async_setup(hass, backend: StubBackend) -> SamsTeamTracker:
+    coordinator = backend.attach(
+        SamsDataCoordinator(hass, None, "baden", "ws://x", "http://x")
+    )
+    await coordinator.async_refresh()
+    tracker = SamsTeamTracker(
+        hass, coordinator, config_entry("Team A", "Oberliga", "e1")
+    )
+    await async_add_to_platform(hass, "sensor", [tracker, tracker.score_sensor])
+    # the tracked match is known from now on
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    return tracker
+
+
+async def test_match_start_on_websocket(tmp_path) -> None:
+    """A start seen on the socket sets the tracker in game and reconciles."""
+    async with async_test_home_assistant(str(tmp_path)) as hass:
+        backend = StubBackend(_region(time.time(), match_state([], started=False)))
+        tracker = await _async_setup(hass, backend)
+        coordinator = tracker.coordinator
+        assert backend.requests == 2
+
+        coordinator._on_data(match_update("m1", match_state([(1, 0)])), time.time())
+        assert hass.states.get(tracker.entity_id).state == STATES_IN
+        assert coordinator._game_active()
+        assert tracker.get_active_state() == IN_GAME
+        await hass.async_block_till_done()
+        assert backend.requests == 3
+
+
+async def test_finish_in_full_update_is_not_fetched_again(tmp_path) -> None:
+    """A finish first seen in a full update does not request another one."""
+    async with async_test_home_assistant(str(tmp_path)) as hass:
+        backend = StubBackend(_region(time.time(), match_state([(20, 10)])))
+        tracker = await _async_setup(hass, backend)
+        backend.data["matchStates"]["m1"] = match_state(
+            [(25, 10), (25, 10), (25, 10)], (3, 0), finished=True
+        )
+
+        await tracker.coordinator.async_refresh()
+        await hass.async_block_till_done()
+        assert backend.requests == 3
+
+
+async def test_lagging_overview_does_not_report_the_start_again(tmp_path) -> None:
+    """A start seen on the socket is reported once, whatever the overview says."""
+    async with async_test_home_assistant(str(tmp_path)) as hass:
+        not_started = match_state([], started=False)
+        backend = StubBackend(_region(time.time(), not_started))
+        tracker = await _async_setup(hass, backend)
+        coordinator = tracker.coordinator
+        started: list[Event] = []
+        hass.bus.async_listen(EVENT_MATCH_STARTED, started.append)
+
+        coordinator._on_data(match_update("m1", match_state([(1, 0)])), time.time())
+        await hass.async_block_till_done()
+        assert len(started) == 1
+        assert backend.requests == 3
+
+        # the reconcile still returns the state before the start
+        await coordinator.async_refresh()
+        coordinator._on_data(match_update("m1", match_state([(2, 0)])), time.time())
+        backend.data["matchStates"]["m1"] = match_state([(2, 0)])
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+        assert len(started) == 1
+        assert backend.requests == 5
+
+
+async def test_flooded_mailbox_keeps_every_rally(tmp_path) -> None:
+    """Timeline and events see every frame, the sensors only the latest one."""
+    async with async_test_home_assistant(str(tmp_path)) as hass:
+        backend = StubBackend(_region(time.time(), match_state([(0, 0)])))
+        tracker = await _async_setup(hass, backend)
+        coordinator = tracker.coordinator
+        points: list[Event] = []
+        hass.bus.async_listen(EVENT_POINT_SCORED, points.append)
+        scores = [((i + 1) // 2, i // 2) for i in range(1, 41)]
+
+        # the reader does not yield to the consumer in between
+        for score in scores:
+            await coordinator._on_message(
+                WSMessage(
+                    WSMsgType.TEXT,
+                    json.dumps(match_update("m1", match_state([score]))),
+                    None,
+                )
+            )
+        await hass.async_block_till_done()
+        assert coordinator.stats["ws_frames_coalesced"] == len(scores) - 1
+        assert len(coordinator._mailbox) == 1
+        assert [event.data["score"] for event in points] == [
+            {"team1": score1, "team2": score2} for score1, score2 in scores
+        ]
+        rallies = coordinator.timelines["m1"].as_dict()["sets"][0]["rallies"]
+        assert [rally[1:] for rally in rallies] == [list(score) for score in scores]
+
+        consumer = asyncio.create_task(coordinator._consume_messages())
+        await asyncio.sleep(0)
+        assert not coordinator._mailbox
+        assert tracker.score_sensor.native_value == "20:20"
+        consumer.cancel()
+
+
+def _ticker_host(body: bytes) -> web.Application:
+    async def tickers(request: web.Request) -> web.StreamResponse:
+        resp = web.StreamResponse(headers={hdrs.CONTENT_ENCODING: "gzip"})
+        resp.content_type = "application/json"
+        # no content length
+        resp.enable_chunked_encoding()
+        await resp.prepare(request)
+        await resp.write(gzip.compress(body))
+        await resp.write_eof()
+        return resp
+
+    app = web.Application()
+    app.router.add_get("/tickers/{region}", tickers)
+    return app
+
+
+async def test_transfer_counts_the_compressed_bytes(tmp_path) -> None:
+    """The wire bytes are the compressed ones, even without content length."""
+    body = json.dumps(_region(time.time(), match_state([]))).encode()
+    async with (
+        async_test_home_assistant(str(tmp_path)) as hass,
+        TestServer(_ticker_host(body)) as server,
+        ClientSession() as session,
+    ):
+        coordinator = SamsDataCoordinator(
+            hass, session, "baden", "ws://x", str(server.make_url("/tickers/baden"))
+        )
+        data = await coordinator.get_full_data()
+        assert data["matchDays"][0]["matches"][0]["id"] == "m1"
+        assert coordinator.stats["get_content_encoding"] == "gzip"
+        assert coordinator.stats["get_bytes_wire"] == len(gzip.compress(body))
+        assert coordinator.stats["get_bytes_decoded"] == len(body)
+
+
+async def _async_best_of(runs: int, frames: list[WSMessage], coordinator) -> float:
+    """Return the fastest of some runs feeding the frames to the coordinator."""
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        for frame in frames:
+            await coordinator._on_message(frame)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+async def test_untracked_frames_are_skipped(tmp_path, monkeypatch) -> None:
+    """Frames of untracked matches are counted and not decoded.
+
+    Benchmark of the skip path against decoding every frame.
+    """
+    async with async_test_home_assistant(str(tmp_path)) as hass:
+        backend = StubBackend(_region(time.time(), match_state([(20, 10)])))
+        tracker = await _async_setup(hass, backend)
+        coordinator = tracker.coordinator
+        sets = [(25, 23), (22, 25), (25, 18), (14, 12)]
+        frames = [
+            WSMessage(
+                WSMsgType.TEXT,
+                json.dumps(match_update(f"other{number}", match_state(sets, (2, 1)))),
+                None,
+            )
+            for number in range(FRAMES)
+        ]
+
+        skipped = await _async_best_of(3, frames, coordinator)
+        assert coordinator.stats["ws_frames_skipped"] == 3 * FRAMES
+        assert not coordinator._mailbox
+
+        monkeypatch.setattr(SamsUtils, "peek_match_uuid", lambda text: None)
+        decoded = await _async_best_of(3, frames, coordinator)
+        assert coordinator.stats["ws_frames_skipped"] == 3 * FRAMES
+        assert len(coordinator._mailbox) == FRAMES
+        coordinator._mailbox.clear()
+
+        timings = (
+            f"{FRAMES} untracked frames: skipped {skipped * 1000:.1f} ms, "
+            f"decoded {decoded * 1000:.1f} ms"
+        )
+        assert skipped * 2 < decoded, timings
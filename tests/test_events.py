@@ -0,0 +1,61 @@
+"""Tests for the samsvolleyball match events."""
+
+from __future__ import annotations
+
+from custom_components.samsvolleyball.const import (
+    EVENT_MATCH_FINISHED,
+    EVENT_MATCH_STARTED,
+    EVENT_POINT_SCORED,
+    EVENT_SET_WON,
+)
+from custom_components.samsvolleyball.events import diff_match_states
+
+from .common import match_state
+
+
+def test_no_events_without_previous_state() -> None:
+    assert diff_match_states(None, match_state([(3, 2)])) == []
+
+
+def test_start_and_point() -> None:
+    events = diff_match_states(match_state([], started=False), match_state([(1, 0)]))
+    assert [event_type for event_type, _ in events] == [
+        EVENT_MATCH_STARTED,
+        EVENT_POINT_SCORED,
+    ]
+    assert events[1][1]["team_num"] == "team1"
+
+
+def test_set_winning_point_with_next_set() -> None:
+    """The winning point is reported if the next set arrives in the same frame."""
+    events = diff_match_states(
+        match_state([(24, 20)]), match_state([(25, 20), (0, 0)], (1, 0))
+    )
+    assert events == [
+        (
+            EVENT_POINT_SCORED,
+            {"team_num": "team1", "set_number": 1, "score": {"team1": 25, "team2": 20}},
+        ),
+        (
+            EVENT_SET_WON,
+            {
+                "team_num": "team1",
+                "set_number": 1,
+                "score": {"team1": 25, "team2": 20},
+                "set_points": {"team1": 1, "team2": 0},
+            },
+        ),
+    ]
+
+
+def test_finish() -> None:
+    events = diff_match_states(
+        match_state([(25, 20), (25, 20), (24, 20)], (2, 0)),
+        match_state([(25, 20), (25, 20), (25, 20)], (3, 0), finished=True),
+    )
+    assert [event_type for event_type, _ in events] == [
+        EVENT_POINT_SCORED,
+        EVENT_SET_WON,
+        EVENT_MATCH_FINISHED,
+    ]
+    assert events[-1][1]["winner_num"] == "team1"
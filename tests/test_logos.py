@@ -0,0 +1,93 @@
+"""Tests for the samsvolleyball logo cache."""
+
+from __future__ import annotations
+
+from aiohttp import hdrs, web
+import pytest
+from aiohttp.test_utils import TestServer
+
+from custom_components.samsvolleyball import logos
+from custom_components.samsvolleyball.logos import LogoCache, SamsLogoView
+
+from .common import async_test_home_assistant
+
+REQUESTS = web.AppKey("requests", list)
+PNG = b"\x89PNG\r\n\x1a\n"
+SVG = b'<svg xmlns="http://www.w3.org/2000/svg"><script>alert(1)</script></svg>'
+
+
+def _logo_host() -> web.Application:
+    async def svg(request: web.Request) -> web.Response:
+        return web.Response(body=SVG, content_type="image/svg+xml")
+
+    async def html(request: web.Request) -> web.Response:
+        return web.Response(text="<script>alert(1)</script>", content_type="text/html")
+
+    async def png(request: web.Request) -> web.Response:
+        request.app[REQUESTS].append(request.headers.get(hdrs.IF_NONE_MATCH))
+        if request.headers.get(hdrs.IF_NONE_MATCH) == '"v1"':
+            return web.Response(status=304)
+        return web.Response(
+            body=PNG, content_type="image/png", headers={hdrs.ETAG: '"v1"'}
+        )
+
+    app = web.Application()
+    app[REQUESTS] = []
+    app.router.add_get("/logo.png", png)
+    app.router.add_get("/logo.svg", svg)
+    app.router.add_get("/logo.html", html)
+    return app
+
+
+async def test_logos_cannot_run_script(tmp_path) -> None:
+    """Logos are sandboxed and only images are served."""
+    async with (
+        async_test_home_assistant(str(tmp_path)) as hass,
+        TestServer(_logo_host()) as server,
+    ):
+        cache = LogoCache(hass, str(tmp_path / "logos"))
+        await cache.async_load()
+        view = SamsLogoView(cache)
+
+        url = cache.proxy_url(str(server.make_url("/logo.svg")))
+        resp = await view.get(None, url.rsplit("/", 1)[-1])
+        assert resp.status == 200
+        assert resp.body == SVG
+        assert resp.content_type == "image/svg+xml"
+        assert "sandbox" in resp.headers["Content-Security-Policy"]
+        assert resp.headers["X-Content-Type-Options"] == "nosniff"
+
+        url = cache.proxy_url(str(server.make_url("/logo.html")))
+        resp = await view.get(None, url.rsplit("/", 1)[-1])
+        assert resp.status == 404
+
+
+async def test_cached_logos_are_served_after_a_restart(tmp_path) -> None:
+    """A new cache on the same directory serves the logos without the host."""
+    async with async_test_home_assistant(str(tmp_path)) as hass:
+        async with TestServer(_logo_host()) as server:
+            cache = LogoCache(hass, str(tmp_path / "logos"))
+            await cache.async_load()
+            key = cache.proxy_url(str(server.make_url("/logo.svg"))).rsplit("/", 1)[-1]
+            assert await cache.async_get(key) == (SVG, "image/svg+xml")
+
+        restarted = LogoCache(hass, str(tmp_path / "logos"))
+        await restarted.async_load()
+        assert await restarted.async_get(key) == (SVG, "image/svg+xml")
+        assert await restarted.async_get("0" * 32) is None
+
+
+async def test_outdated_logos_are_revalidated(
+    tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """An unchanged logo is kept, a failing host serves the stale one."""
+    monkeypatch.setattr(logos, "LOGO_REVALIDATE", -1)
+    async with async_test_home_assistant(str(tmp_path)) as hass:
+        cache = LogoCache(hass, str(tmp_path / "logos"))
+        await cache.async_load()
+        async with TestServer(_logo_host()) as server:
+            key = cache.proxy_url(str(server.make_url("/logo.png"))).rsplit("/", 1)[-1]
+            assert await cache.async_get(key) == (PNG, "image/png")
+            assert await cache.async_get(key) == (PNG, "image/png")
+            assert server.app[REQUESTS] == [None, '"v1"']
+        assert await cache.async_get(key) == (PNG, "image/png")
@@ -0,0 +1,171 @@
+"""Measure the recorder rows written for the team tracker during a match.
+
+The recorder writes a states row per state change and a state_attributes row
+per distinct set of recorded attributes. Both are computed here from the
+state_changed events like the recorder does, without a database.
+"""
+
+from __future__ import annotations
+
+import time
+
+from homeassistant.const import (
+    ATTR_ATTRIBUTION,
+    ATTR_RESTORED,
+    ATTR_SUPPORTED_FEATURES,
+    EVENT_STATE_CHANGED,
+    STATE_UNAVAILABLE,
+)
+from homeassistant.core import Event, State
+from homeassistant.helpers.json import json_bytes
+
+from custom_components.samsvolleyball import SamsDataCoordinator
+from custom_components.samsvolleyball.sensor import SamsTeamTracker
+
+from .common import (
+    StubBackend,
+    async_add_to_platform,
+    async_test_home_assistant,
+    config_entry,
+    match,
+    match_state,
+    match_update,
+    overview,
+    series,
+    team,
+)
+
+# excluded by the recorder for all domains
+ALL_DOMAIN_EXCLUDE_ATTRS = {ATTR_ATTRIBUTION, ATTR_RESTORED, ATTR_SUPPORTED_FEATURES}
+
+
+def _attributes_row(state: State, unrecorded: bool) -> bytes:
+    exclude = set(ALL_DOMAIN_EXCLUDE_ATTRS)
+    if unrecorded and state.state_info:
+        exclude |= state.state_info["unrecorded_attributes"]
+    return json_bytes({k: v for k, v in state.attributes.items() if k not in exclude})
+
+
+def _match(sets: list[tuple[int, int]]) -> list[dict]:
+    """Return the states of a match, point by point and both teams in turn."""
+    states = []
+    played: list[tuple[int, int]] = []
+    set_points = (0, 0)
+    for score1, score2 in sets:
+        points = score1 + score2
+        for point in range(1, points + 1):
+            team1 = round(point * score1 / points)
+            states.append(match_state([*played, (team1, point - team1)], set_points))
+        played.append((score1, score2))
+        set_points = (
+            set_points[0] + (score1 > score2),
+            set_points[1] + (score2 > score1),
+        )
+    states.append(match_state(played, set_points, finished=True))
+    return states
+
+
+async def _async_setup(hass, backend: StubBackend) -> SamsTeamTracker:
+    coordinator = backend.attach(
+        SamsDataCoordinator(hass, None, "baden", "ws://x", "http://x")
+    )
+    await coordinator.async_refresh()
+    tracker = SamsTeamTracker(
+        hass, coordinator, config_entry("Team A", "Oberliga", "e1")
+    )
+    await async_add_to_platform(hass, "sensor", [tracker, tracker.score_sensor])
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    return tracker
+
+
+async def test_recorder_rows_of_a_match(tmp_path) -> None:
+    """The score sensor records the points, the tracker only sets and states."""
+    async with async_test_home_assistant(str(tmp_path)) as hass:
+        league = series(
+            "league", "Oberliga", [team("a", "Team A"), team("b", "Team B")]
+        )
+        backend = StubBackend(
+            overview(
+                [league],
+                [match("m1", "a", "b", time.time())],
+                {"m1": match_state([(0, 0)])},
+            )
+        )
+        tracker = await _async_setup(hass, backend)
+        entity_ids = {tracker.entity_id, tracker.score_sensor.entity_id}
+        events: list[Event] = []
+        hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            lambda event: (
+                events.append(event) if event.data["entity_id"] in entity_ids else None
+            ),
+        )
+
+        sets = [(25, 20), (23, 25), (25, 18), (25, 22)]
+        frames = _match(sets)
+        # before: the tracker was written with all attributes on every frame
+        rows_before = set()
+        for frame in frames:
+            tracker.coordinator._on_data(match_update("m1", frame), time.time())
+            rows_before.add(
+                _attributes_row(State(tracker.entity_id, "in", tracker._attr), False)
+            )
+        await hass.async_block_till_done()
+
+        tracker_states = [
+            event.data["new_state"]
+            for event in events
+            if event.data["entity_id"] == tracker.entity_id
+        ]
+        score_states = [
+            event.data["new_state"]
+            for event in events
+            if event.data["entity_id"] == tracker.score_sensor.entity_id
+        ]
+        assert score_states[-1].state == "3:1"
+        assert tracker_states[-1].attributes["team_sets_won"] == 3
+
+        # after: the score sensor is written per point, the tracker per set
+        rows_after = {_attributes_row(state, True) for state in tracker_states} | {
+            _attributes_row(state, True) for state in score_states
+        }
+        states_before = len(frames)
+        states_after = len(tracker_states) + len(score_states)
+        bytes_before = sum(map(len, rows_before))
+        bytes_after = sum(map(len, rows_after))
+        rows = (
+            f"{len(frames)} frames: states rows {states_before} before,"
+            f" {len(tracker_states)} + {len(score_states)} after;"
+            f" attribute rows {len(rows_before)} ({bytes_before} bytes) before,"
+            f" {len(rows_after)} ({bytes_after} bytes) after"
+        )
+        assert len(tracker_states) <= len(sets) + 2, rows
+        assert states_after <= states_before + len(sets) + 2, rows
+        assert len(rows_after) <= len(rows_before) // 10, rows
+        assert (
+            states_after + len(rows_after) < (states_before + len(rows_before)) * 0.6
+        ), rows
+        assert bytes_after * 10 < bytes_before, rows
+
+
+async def test_score_sensor_availability(tmp_path) -> None:
+    """The score sensor writes failure and recovery of the coordinator."""
+    async with async_test_home_assistant(str(tmp_path)) as hass:
+        league = series(
+            "league", "Oberliga", [team("a", "Team A"), team("b", "Team B")]
+        )
+        backend = StubBackend(
+            overview([league], [match("m1", "a", "b", time.time() + 86400)])
+        )
+        tracker = await _async_setup(hass, backend)
+        score_id = tracker.score_sensor.entity_id
+        assert hass.states.get(score_id).state == "unknown"
+
+        backend.fail = True
+        await tracker.coordinator.async_refresh()
+        assert hass.states.get(score_id).state == STATE_UNAVAILABLE
+
+        backend.fail = False
+        await tracker.coordinator.async_refresh()
+        assert hass.states.get(score_id).state == "unknown"
@@ -0,0 +1,142 @@
+"""Tests for the samsvolleyball relay."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+
+from aiohttp import WSMsgType, web
+from aiohttp.test_utils import TestClient, TestServer
+import pytest
+
+from custom_components.samsvolleyball import const, relay as relay_module
+from custom_components.samsvolleyball.const import CONF_REGION_LIST
+from custom_components.samsvolleyball.relay import RegionUpstream, create_app
+
+REGION = CONF_REGION_LIST[0]
+OVERVIEW = {"matchSeries": {}, "matchDays": []}
+
+
+class FakeSams:
+    """Upstream with the GET and WebSocket endpoints of the SAMS backend."""
+
+    def __init__(self) -> None:
+        self.gets = 0
+        self.sockets: list[web.WebSocketResponse] = []
+        self.connected = asyncio.Event()
+        self.app = web.Application()
+        self.app.router.add_get("/tickers/{region}", self._get)
+        self.app.router.add_get("/ws/{region}", self._ws)
+
+    async def _get(self, request: web.Request) -> web.Response:
+        self.gets += 1
+        return web.json_response(OVERVIEW)
+
+    async def _ws(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.sockets.append(ws)
+        self.connected.set()
+        async for _ in ws:
+            pass
+        return ws
+
+    async def broadcast(self, data: str) -> None:
+        for ws in self.sockets:
+            if not ws.closed:
+                await ws.send_str(data)
+
+
+async def _receive(ws) -> str:
+    msg = await asyncio.wait_for(ws.receive(), 5)
+    assert msg.type == WSMsgType.TEXT
+    return msg.data
+
+
+async def test_relay_shares_the_upstream() -> None:
+    """The overview is cached and one upstream socket serves all clients."""
+    upstream = FakeSams()
+    async with TestServer(upstream.app) as server:
+        relay = create_app(
+            str(server.make_url("/ws/")), str(server.make_url("/tickers/"))
+        )
+        async with TestClient(TestServer(relay)) as client:
+            for _ in range(3):
+                resp = await client.get(f"/live/indoor/tickers/{REGION}")
+                assert resp.status == 200
+                assert await resp.json() == OVERVIEW
+            assert upstream.gets == 1
+
+            resp = await client.get("/live/indoor/tickers/unknown")
+            assert resp.status == 404
+
+            ws1 = await client.ws_connect(f"/indoor/{REGION}")
+            ws2 = await client.ws_connect(f"/indoor/{REGION}")
+            await asyncio.wait_for(upstream.connected.wait(), 5)
+            # give the second client the chance to open another upstream
+            await asyncio.sleep(0.1)
+            assert len(upstream.sockets) == 1
+
+            frame = json.dumps({"type": "MATCH_UPDATE", "payload": {}})
+            await upstream.broadcast(frame)
+            assert await _receive(ws1) == frame
+            assert await _receive(ws2) == frame
+
+            await ws1.close()
+            await upstream.broadcast(frame)
+            assert await _receive(ws2) == frame
+            await ws2.close()
+            await asyncio.sleep(0.1)
+            assert all(ws.closed for ws in upstream.sockets)
+
+
+def test_relay_constants_match_the_integration() -> None:
+    """The relay keeps its own copy of the backend constants."""
+    assert relay_module.URL_WS == const.DEFAULT_OPTIONS[const.CONF_HOST]
+    assert relay_module.URL_GET == const.URL_GET
+    assert list(relay_module.REGION_LIST) == const.CONF_REGION_LIST
+    assert relay_module.GET_HEADERS == const.GET_HEADERS
+    assert relay_module.HEADERS == const.HEADERS
+    assert relay_module.WS_COMPRESS == const.WS_COMPRESS
+
+
+def test_relay_runs_without_homeassistant(tmp_path) -> None:
+    """The script starts on a host where homeassistant can not be imported."""
+    blocked = tmp_path / "homeassistant"
+    blocked.mkdir()
+    (blocked / "__init__.py").write_text('raise ImportError("no homeassistant")')
+    result = subprocess.run(
+        [sys.executable, relay_module.__file__, "--help"],
+        env={**os.environ, "PYTHONPATH": str(tmp_path)},
+        capture_output=True,
+        text=True,
+        check=False,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    assert "--ws-base" in result.stdout
+
+
+async def test_upstream_survives_unexpected_errors(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Timeouts and unexpected errors of the upstream do not end the loop."""
+    monkeypatch.setattr(relay_module, "RECONNECT_DELAY", 0)
+    attempts: list[type[Exception]] = []
+    errors = [TimeoutError, RuntimeError]
+
+    class FailingSession:
+        def ws_connect(self, url, **kwargs):
+            error = errors[len(attempts) % len(errors)]
+            attempts.append(error)
+            if len(attempts) >= 4:
+                upstream.clients.clear()
+            raise error
+
+    upstream = RegionUpstream(FailingSession(), REGION, "ws://x/", "http://x/")
+    upstream.clients.add(object())
+    await asyncio.wait_for(upstream._run(), 5)
+    assert attempts == [TimeoutError, RuntimeError, TimeoutError, RuntimeError]
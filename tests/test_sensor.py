@@ -0,0 +1,156 @@
+"""Tests for the samsvolleyball sensors."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.util import dt as dt_util
+
+from custom_components.samsvolleyball import SamsDataCoordinator
+from custom_components.samsvolleyball.const import NEAR_GAME, NO_GAME
+from custom_components.samsvolleyball.sensor import SamsTeamTracker
+
+from .common import (
+    StubBackend,
+    async_add_to_platform,
+    async_test_home_assistant,
+    config_entry,
+    match,
+    match_state,
+    overview,
+    series,
+    team,
+)
+
+
+def _region(now: float) -> dict:
+    league = series(
+        "league",
+        "Oberliga",
+        [team("a", "Team A"), team("b", "Team B"), team("c", "Team C")],
+    )
+    return overview(
+        [league],
+        [
+            match("m1", "a", "b", now + 5 * 86400),
+            match("m2", "b", "c", now + 6 * 86400),
+        ],
+    )
+
+
+async def test_unaffected_update_is_skipped(tmp_path) -> None:
+    """A full update not touching the team does not write the tracker."""
+    async with async_test_home_assistant(str(tmp_path)) as hass:
+        backend = StubBackend(_region(time.time()))
+        coordinator = backend.attach(
+            SamsDataCoordinator(hass, None, "baden", "ws://x", "http://x")
+        )
+        await coordinator.async_refresh()
+        tracker = SamsTeamTracker(
+            hass, coordinator, config_entry("Team A", "Oberliga", "e1")
+        )
+        await async_add_to_platform(hass, "sensor", [tracker, tracker.score_sensor])
+        written = hass.states.get(tracker.entity_id)
+
+        await coordinator.async_refresh()
+        assert not any(coordinator.changes)
+        assert hass.states.get(tracker.entity_id) is written
+
+
+async def test_availability_is_written_after_unchanged_update(tmp_path) -> None:
+    """Failure and recovery are written although the overview did not change."""
+    async with async_test_home_assistant(str(tmp_path)) as hass:
+        backend = StubBackend(_region(time.time()))
+        coordinator = backend.attach(
+            SamsDataCoordinator(hass, None, "baden", "ws://x", "http://x")
+        )
+        await coordinator.async_refresh()
+        tracker = SamsTeamTracker(
+            hass, coordinator, config_entry("Team A", "Oberliga", "e1")
+        )
+        await async_add_to_platform(hass, "sensor", [tracker, tracker.score_sensor])
+        assert hass.states.get(tracker.entity_id).state == "PRE"
+
+        backend.fail = True
+        await coordinator.async_refresh()
+        assert hass.states.get(tracker.entity_id).state == STATE_UNAVAILABLE
+
+        backend.fail = False
+        await coordinator.async_refresh()
+        assert not any(coordinator.changes)
+        assert hass.states.get(tracker.entity_id).state == "PRE"
+
+
+async def test_active_state_follows_overview_and_clock(
+    tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The memoized activity and selection are recomputed when they may change."""
+    async with async_test_home_assistant(str(tmp_path)) as hass:
+        start = time.time()
+        now = [start]
+        league = series("league", "Oberliga", [team("a", "Team A"), team("b", "B")])
+        finished = match_state([(25, 20), (25, 20), (25, 20)], (3, 0), finished=True)
+        backend = StubBackend(
+            overview(
+                [league],
+                [
+                    match("m0", "a", "b", start - 2 * 3600),
+                    match("m1", "b", "a", start + 5 * 86400),
+                ],
+                {"m0": finished},
+            )
+        )
+        coordinator = backend.attach(
+            SamsDataCoordinator(
+                hass,
+                None,
+                "baden",
+                "ws://x",
+                "http://x",
+                clock=lambda: dt_util.utc_from_timestamp(now[0]),
+            )
+        )
+        await coordinator.async_refresh()
+        tracker = SamsTeamTracker(
+            hass, coordinator, config_entry("Team A", "Oberliga", "e1")
+        )
+        await async_add_to_platform(hass, "sensor", [tracker, tracker.score_sensor])
+        computed: list[float] = []
+        compute = tracker._compute_active_state
+
+        def _compute(now_ts: float) -> tuple[int, float | None]:
+            computed.append(now_ts)
+            return compute(now_ts)
+
+        monkeypatch.setattr(tracker, "_compute_active_state", _compute)
+
+        # the finished match is shown up to 3 hours after its kickoff
+        assert tracker._match["id"] == "m0"
+        assert tracker.get_active_state() == NEAR_GAME
+        assert tracker.get_active_state() == NEAR_GAME
+        assert len(computed) == 1
+
+        now[0] = start + 2 * 3600
+        assert tracker.get_active_state() == NO_GAME
+        assert tracker.get_active_state() == NO_GAME
+        assert len(computed) == 2
+
+        # a day after its kickoff the next match is selected, the same overview
+        now[0] = start + 23 * 3600
+        await coordinator.async_refresh()
+        assert not any(coordinator.changes)
+        assert tracker._match["id"] == "m1"
+        assert tracker.get_active_state() == NO_GAME
+        assert len(computed) == 3
+
+        # a new overview moves the next match to the next hour
+        backend.data["matchDays"][0]["matches"][1]["date"] = str(
+            int((now[0] + 3600) * 1000)
+        )
+        await coordinator.async_refresh()
+        assert coordinator.changes.matches == {"m1"}
+        assert tracker.get_active_state() == NEAR_GAME
+        assert len(computed) == 4
@@ -0,0 +1,39 @@
+"""Tests for the samsvolleyball services."""
+
+from __future__ import annotations
+
+from custom_components.samsvolleyball.const import (
+    DOMAIN,
+    SERVICE_CAPTURE_PROFILE,
+    SERVICE_GET_MATCH_HISTORY,
+    SERVICE_GET_MATCH_TIMELINE,
+    SERVICE_MEMORY_REPORT,
+    SERVICE_SET_PROFILING,
+)
+from custom_components.samsvolleyball.services import async_setup_services
+
+from .common import async_test_home_assistant
+
+
+async def test_setup_registers_all_services(tmp_path) -> None:
+    """All services are registered once, a second setup is a no-op."""
+    async with async_test_home_assistant(str(tmp_path)) as hass:
+        async_setup_services(hass)
+        async_setup_services(hass)
+        assert set(hass.services.async_services()[DOMAIN]) == {
+            SERVICE_GET_MATCH_TIMELINE,
+            SERVICE_SET_PROFILING,
+            SERVICE_CAPTURE_PROFILE,
+            SERVICE_MEMORY_REPORT,
+            SERVICE_GET_MATCH_HISTORY,
+        }
+
+
+async def test_memory_report_without_regions(tmp_path) -> None:
+    """A service with response can be called without any region set up."""
+    async with async_test_home_assistant(str(tmp_path)) as hass:
+        async_setup_services(hass)
+        response = await hass.services.async_call(
+            DOMAIN, SERVICE_MEMORY_REPORT, {}, blocking=True, return_response=True
+        )
+        assert response == {"regions": {}}
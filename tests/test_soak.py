@@ -0,0 +1,346 @@
+"""Soak test of the samsvolleyball integration over a simulated season.
+
+A virtual clock drives the coordinator and its trackers through weekly
+matchdays against a stand-in of the ticker backend. Config entries are set
+up and unloaded with the entry points of the integration, the websocket is
+dropped by the backend during every match. Memory, objects and live tasks
+must stay flat from the second block of matchdays on.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+import gc
+import importlib
+import json
+import logging
+import resource
+from typing import Any
+
+from aiohttp import WSMessage, WSMsgType
+import pytest
+
+from homeassistant.config_entries import ConfigEntry, current_entry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import EntityPlatform
+from homeassistant.util import dt as dt_util
+
+import custom_components.samsvolleyball as integration
+from custom_components.samsvolleyball import SamsDataCoordinator
+from custom_components.samsvolleyball.const import DOMAIN, EVENT_MATCH_FINISHED
+
+from .common import (
+    StubBackend,
+    async_test_home_assistant,
+    config_entry,
+    match,
+    match_state,
+    match_update,
+    overview,
+    series,
+    team,
+)
+
+MATCHDAYS_PER_BLOCK = 4
+BLOCKS = 6
+MATCH_DURATION = 90 * 60
+STEP_NEAR_GAME = timedelta(minutes=5)
+STEP_NO_GAME = timedelta(hours=2)
+# stepped in minutes around the kickoff, the trackers are active from 2h before
+NEAR_GAME_WINDOW = (3 * 60 * 60, 4 * 60 * 60)
+TEAMS = ("a", "b", "c", "d")
+
+# growth allowed from the second to the last block - the overview of the
+# stand-in grows by the finished matches
+MAX_RSS_GROWTH_KB = 2048
+MAX_OBJECT_GROWTH = 500
+
+
+class VirtualClock:
+    """Clock of the coordinators, moved on by the test."""
+
+    def __init__(self, start: datetime) -> None:
+        """Init the clock at start."""
+        self.now = start
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def ts(self) -> float:
+        return self.now.timestamp()
+
+
+class FakeSocket:
+    """Client websocket fed by the season backend."""
+
+    compress = 0
+
+    def __init__(self) -> None:
+        """Init an open socket."""
+        self._queue: asyncio.Queue[str | None] = asyncio.Queue()
+        self.closed = False
+
+    def send(self, data: str) -> None:
+        if not self.closed:
+            self._queue.put_nowait(data)
+
+    def drop(self) -> None:
+        """Close the socket from the server side."""
+        if not self.closed:
+            self.closed = True
+            self._queue.put_nowait(None)
+
+    async def close(self) -> None:
+        self.drop()
+
+    def __aiter__(self) -> FakeSocket:
+        return self
+
+    async def __anext__(self) -> WSMessage:
+        data = await self._queue.get()
+        if data is None:
+            raise StopAsyncIteration
+        return WSMessage(WSMsgType.TEXT, data, None)
+
+
+class SeasonBackend(StubBackend):
+    """Ticker backend of a region playing a match every matchday.
+
+    The overview and the websocket frames follow the virtual clock, the
+    sockets are dropped once during every match.
+    """
+
+    def __init__(self, clock: VirtualClock, matchdays: int) -> None:
+        """Init the schedule of the season - one matchday per week."""
+        self.clock = clock
+        self.kickoffs = {
+            f"m{day}": clock.ts() + timedelta(days=7 * day + 2).total_seconds()
+            for day in range(matchdays)
+        }
+        self.sockets: list[FakeSocket] = []
+        self.connects = 0
+        super().__init__(self._overview())
+
+    def _pairing(self, match_id: str) -> tuple[str, str]:
+        # team a plays on even, team c on odd matchdays
+        day = int(match_id[1:])
+        return TEAMS[2 * (day % 2)], TEAMS[2 * (day % 2) + 1]
+
+    def _state(self, match_id: str) -> dict | None:
+        played = self.clock.ts() - self.kickoffs[match_id]
+        if played < 0:
+            return None
+        if played >= MATCH_DURATION:
+            return match_state([(25, 20), (25, 20), (25, 20)], (3, 0), finished=True)
+        points = int(played // 60) % 25
+        return match_state([(points, points // 2)])
+
+    def _overview(self) -> dict:
+        league = series("league", "Oberliga", [team(t, f"Team {t}") for t in TEAMS])
+        states = {
+            match_id: state
+            for match_id in self.kickoffs
+            if (state := self._state(match_id)) is not None
+        }
+        return overview(
+            [league],
+            [
+                match(match_id, *self._pairing(match_id), kickoff_ts)
+                for match_id, kickoff_ts in self.kickoffs.items()
+            ],
+            states,
+        )
+
+    async def async_get_body(self) -> bytes:
+        self.data = self._overview()
+        return await super().async_get_body()
+
+    async def ws_connect(self, url: str, **kwargs: Any) -> FakeSocket:
+        self.connects += 1
+        self.sockets = [ws for ws in self.sockets if not ws.closed]
+        self.sockets.append(FakeSocket())
+        return self.sockets[-1]
+
+    def live_matches(self) -> list[str]:
+        return [
+            match_id
+            for match_id, kickoff_ts in self.kickoffs.items()
+            if 0 <= self.clock.ts() - kickoff_ts < MATCH_DURATION
+        ]
+
+    def tick(self) -> None:
+        """Send the state of the live matches, drop the sockets mid-match."""
+        for match_id in self.live_matches():
+            frame = json.dumps(match_update(match_id, self._state(match_id)))
+            for ws in self.sockets:
+                ws.send(frame)
+            if self.clock.ts() - self.kickoffs[match_id] == MATCH_DURATION // 2:
+                for ws in self.sockets:
+                    ws.drop()
+
+
+class FakeHttp:
+    """Stand-in for the http component, views are only recorded."""
+
+    def __init__(self) -> None:
+        """Init without views."""
+        self.views: list = []
+
+    def register_view(self, view) -> None:
+        self.views.append(view)
+
+
+class FakeConfigEntries:
+    """Sets up config entries like Home Assistant, without loading components."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Init without entries."""
+        self.hass = hass
+        self.platforms: dict[str, list] = {}
+
+    async def async_setup(self, entry: ConfigEntry) -> bool:
+        current_entry.set(entry)
+        return await integration.async_setup_entry(self.hass, entry)
+
+    async def async_unload(self, entry: ConfigEntry) -> bool:
+        unload_ok = await integration.async_unload_entry(self.hass, entry)
+        await entry._async_process_on_unload(self.hass)
+        return unload_ok
+
+    async def async_forward_entry_setups(
+        self, entry: ConfigEntry, platforms: list[str]
+    ) -> None:
+        for domain in platforms:
+            platform = EntityPlatform(
+                hass=self.hass,
+                logger=logging.getLogger(__name__),
+                domain=domain,
+                platform_name=DOMAIN,
+                platform=importlib.import_module(f"{integration.__name__}.{domain}"),
+                scan_interval=timedelta(seconds=30),
+                entity_namespace=None,
+            )
+            await platform.async_setup_entry(entry)
+            self.platforms.setdefault(entry.entry_id, []).append(platform)
+
+    async def async_unload_platforms(
+        self, entry: ConfigEntry, platforms: list[str]
+    ) -> bool:
+        for platform in self.platforms.pop(entry.entry_id):
+            await platform.async_reset()
+        return True
+
+    def async_get_entry(self, entry_id: str) -> None:
+        return None
+
+
+def _rss_kb() -> int:
+    with open("/proc/self/statm", encoding="ascii") as statm:
+        return int(statm.read().split()[1]) * resource.getpagesize() // 1024
+
+
+def _object_count() -> int:
+    gc.collect()
+    return len(gc.get_objects())
+
+
+async def _async_play(
+    hass: HomeAssistant, clock: VirtualClock, backend: SeasonBackend, matchdays: int
+) -> None:
+    """Move the clock on by weeks, in minutes around the kickoffs."""
+    coordinator: SamsDataCoordinator = hass.data[DOMAIN]["baden"]
+    end = clock.now + timedelta(days=7 * matchdays)
+    while clock.now < end:
+        ts = clock.ts()
+        nearby = any(
+            -NEAR_GAME_WINDOW[0] <= ts - kickoff_ts < NEAR_GAME_WINDOW[1]
+            for kickoff_ts in backend.kickoffs.values()
+        )
+        clock.now += STEP_NEAR_GAME if nearby else STEP_NO_GAME
+        backend.tick()
+        await coordinator.periodic_work(clock.now)
+        if clock.ts() - coordinator.last_get_ts >= (
+            coordinator.update_interval.total_seconds()
+        ):
+            await coordinator.async_refresh()
+        await hass.async_block_till_done()
+
+
+async def _async_run_block(
+    hass: HomeAssistant,
+    clock: VirtualClock,
+    backend: SeasonBackend,
+    entries: list[ConfigEntry],
+    matchdays: int,
+) -> None:
+    """Set up the entries, play the matchdays and unload the entries again.
+
+    The first entry is removed before the last matchday, the coordinator of
+    the region has to go on for the other one.
+    """
+    config_entries: FakeConfigEntries = hass.config_entries
+    for entry in entries:
+        assert await config_entries.async_setup(entry)
+    await hass.async_block_till_done()
+    coordinator: SamsDataCoordinator = hass.data[DOMAIN]["baden"]
+
+    await _async_play(hass, clock, backend, matchdays - 1)
+    assert await config_entries.async_unload(entries[0])
+    requests = backend.requests
+    await _async_play(hass, clock, backend, 1)
+    assert hass.data[DOMAIN]["baden"] is coordinator
+    assert backend.requests > requests
+
+    for entry in entries[1:]:
+        assert await config_entries.async_unload(entry)
+    await hass.async_block_till_done()
+    assert "baden" not in hass.data[DOMAIN]
+    assert not coordinator.has_listener()[0]
+    assert coordinator.ws is None
+    assert coordinator.ws_task is None
+
+
+async def test_season_keeps_memory_and_tasks_flat(
+    tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A season of matchdays with entries added and removed does not leak."""
+    async with async_test_home_assistant(str(tmp_path)) as hass:
+        # start in the future, real time timers of the trackers are no-ops
+        start = dt_util.start_of_local_day(dt_util.now() + timedelta(days=365))
+        clock = VirtualClock(dt_util.as_utc(start))
+        backend = SeasonBackend(clock, BLOCKS * MATCHDAYS_PER_BLOCK)
+
+        def _coordinator(*args: Any, **kwargs: Any) -> SamsDataCoordinator:
+            coordinator = backend.attach(
+                SamsDataCoordinator(*args, clock=clock, **kwargs)
+            )
+            coordinator.session = backend
+            return coordinator
+
+        monkeypatch.setattr(integration, "SamsDataCoordinator", _coordinator)
+        hass.http = FakeHttp()
+        hass.config_entries = FakeConfigEntries(hass)
+        finished: list[str] = []
+        hass.bus.async_listen(
+            EVENT_MATCH_FINISHED, lambda event: finished.append(event.data["match_id"])
+        )
+        entries = [
+            config_entry("Team a", "Oberliga", "e1"),
+            config_entry("Team c", "Oberliga", "e2"),
+        ]
+        samples: list[tuple[int, int, int]] = []
+        for _ in range(BLOCKS):
+            await _async_run_block(hass, clock, backend, entries, MATCHDAYS_PER_BLOCK)
+            samples.append((_rss_kb(), _object_count(), len(asyncio.all_tasks())))
+
+        assert sorted(finished) == sorted(backend.kickoffs)
+        assert backend.connects >= 2 * len(backend.kickoffs)
+        assert not any(ws for ws in backend.sockets if not ws.closed)
+        # the first block warms up caches, imports and the archive
+        (rss_first, objects_first, tasks_first) = samples[1]
+        (rss_last, objects_last, tasks_last) = samples[-1]
+        growth = f"rss kB, objects, tasks after each block: {samples}"
+        assert rss_last - rss_first <= MAX_RSS_GROWTH_KB, growth
+        assert objects_last - objects_first <= MAX_OBJECT_GROWTH, growth
+        assert tasks_last <= tasks_first, growth
@@ -0,0 +1,36 @@
+"""Tests for the samsvolleyball utilities."""
+
+from __future__ import annotations
+
+import json
+
+from custom_components.samsvolleyball.utils import SamsUtils
+
+from .common import match_state, match_update
+
+
+def test_peek_match_uuid() -> None:
+    """The uuid of a match update is peeked whatever the order of the keys."""
+    frame = match_update("m1", match_state([(25, 20), (3, 1)], (1, 0)))
+    assert SamsUtils.peek_match_uuid(json.dumps(frame)) == "m1"
+
+    reordered = {"payload": frame["payload"], "type": frame["type"]}
+    assert SamsUtils.peek_match_uuid(json.dumps(reordered, indent=2)) == "m1"
+
+    assert SamsUtils.peek_match_uuid(json.dumps({"type": "PING"})) is None
+    assert SamsUtils.peek_match_uuid("{}") is None
+
+
+def test_peek_match_uuid_falls_back_on_nested_keys() -> None:
+    """Keys nested in the payload make the frame ambiguous - it is decoded."""
+    nested_uuid = {
+        "type": "MATCH_UPDATE",
+        "payload": {"previous": {"matchUuid": "m0"}, "matchUuid": "m1"},
+    }
+    assert SamsUtils.peek_match_uuid(json.dumps(nested_uuid)) is None
+
+    nested_type = {
+        "payload": {"type": "MATCH_UPDATE", "matchUuid": "m1"},
+        "type": "TICKER_UPDATE",
+    }
+    assert SamsUtils.peek_match_uuid(json.dumps(nested_type)) is None